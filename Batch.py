@@ -0,0 +1,341 @@
+"""
+Command-line batch solving.
+
+Reads grids from files, directories or stdin and fills them in a process
+pool, writing one JSON object per grid to stdout as soon as it is solved.
+Accepted inputs:
+    - Puzzles/grids.txt style files: a "name: (rows,cols)" header followed
+      by one JSON list per grid row.
+    - JSON files holding a grid (a list of rows), an object with "grid" and
+      an optional "name", or a list of either.
+    - JSONL streams with one such grid or object per line.
+
+Usage:
+    python Batch.py Puzzles/grids.txt
+    python Batch.py --workers 8 --words Words.dict nightly/ > results.jsonl
+    cat grids.jsonl | python Batch.py -
+"""
+import argparse
+import json
+import os
+import re
+import sys
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+from Engine import (DEFAULT_WORDS, GridError, RESTART_STRATEGIES,
+                    VALUE_RANDOMIZATIONS, VARIABLE_HEURISTICS)
+from Portfolio import init_worker, worker_engine
+
+# File types picked up when a directory is given
+GRID_SUFFIXES = (".txt", ".json", ".jsonl")
+
+# Header line of a grid in the Puzzles/grids.txt format, e.g. "basic: (7,6)"
+GRID_HEADER = re.compile(r"^\s*([^:\[]+?)\s*:\s*\(\s*\d+\s*,\s*\d+\s*\)\s*$")
+
+
+# ------------------------- Reading Grids -------------------------
+
+def parse_grids_text(text, source):
+    """
+    Parse grids written in the Puzzles/grids.txt format.
+
+    Args:
+        text (str): The file contents.
+        source (str): Name of the input, used to label the grids.
+
+    Yields:
+        tuple: (name, source, grid) for every grid in the text.
+    """
+    name = None
+    rows = []
+    for line in text.splitlines():
+        header = GRID_HEADER.match(line)
+        stripped = line.strip().rstrip(",")
+        if header:
+            if rows:
+                yield name, source, rows
+            name, rows = header.group(1), []
+        elif stripped.startswith("["):
+            rows.append(json.loads(stripped))
+        elif rows and not stripped:
+            yield name, source, rows
+            name, rows = None, []
+    if rows:
+        yield name, source, rows
+
+
+def parse_json_item(item, source, default_name):
+    """
+    Unpack one grid given as JSON.
+
+    Args:
+        item: A list of rows, or an object with "grid" and optional "name".
+        source (str): Name of the input.
+        default_name (str): Name used when the item has none.
+
+    Returns:
+        tuple: (name, source, grid).
+
+    Raises:
+        ValueError: If the item is neither form.
+    """
+    if isinstance(item, dict):
+        if "grid" not in item:
+            raise ValueError(f"{source}: grid object without a 'grid' field")
+        return item.get("name", default_name), source, item["grid"]
+    if isinstance(item, list):
+        return default_name, source, item
+    raise ValueError(f"{source}: expected a grid or an object with a 'grid' field")
+
+
+def parse_json(data, source):
+    """
+    Unpack the grids of a JSON document.
+
+    Args:
+        data: The decoded document: a grid, a grid object, or a list of them.
+        source (str): Name of the input.
+
+    Yields:
+        tuple: (name, source, grid).
+    """
+    # A single grid is a list of rows, which are themselves lists
+    if isinstance(data, list) and data and all(isinstance(row, list) for row in data) \
+            and all(not isinstance(cell, (list, dict)) for row in data for cell in row):
+        yield parse_json_item(data, source, source)
+    elif isinstance(data, list):
+        for i, item in enumerate(data):
+            yield parse_json_item(item, source, f"{source}#{i}")
+    else:
+        yield parse_json_item(data, source, source)
+
+
+def read_stream(stream, source):
+    """
+    Read grids from an open text stream, detecting the format.
+
+    JSONL input is consumed line by line, so an endless stream can be
+    processed; other formats are read whole.
+
+    Args:
+        stream: The text stream.
+        source (str): Name of the input.
+
+    Yields:
+        tuple: (name, source, grid).
+    """
+    first = ""
+    for first in stream:
+        if first.strip():
+            break
+    if not first.strip():
+        return
+
+    try:
+        data = json.loads(first)
+    except ValueError:
+        data = None
+    if data is not None:
+        # The first line is a complete JSON value, so treat the input as JSONL
+        yield from parse_json(data, f"{source}:1")
+        for number, line in enumerate(stream, start=2):
+            if line.strip():
+                yield from parse_json(json.loads(line), f"{source}:{number}")
+        return
+
+    text = first + stream.read()
+    if text.lstrip().startswith(("[", "{")):
+        yield from parse_json(json.loads(text), source)
+    else:
+        yield from parse_grids_text(text, source)
+
+
+def read_grids(paths):
+    """
+    Read grids from files, directories and stdin ("-").
+
+    Args:
+        paths (list): Inputs in order; directories contribute their
+            .txt, .json and .jsonl files in name order.
+
+    Yields:
+        tuple: (name, source, grid).
+    """
+    for path in paths:
+        if path == "-":
+            yield from read_stream(sys.stdin, "<stdin>")
+        elif os.path.isdir(path):
+            for entry in sorted(os.listdir(path)):
+                if entry.endswith(GRID_SUFFIXES):
+                    yield from read_grids([os.path.join(path, entry)])
+        else:
+            with open(path, 'r') as f:
+                yield from read_stream(f, path)
+
+
+# ------------------------- Solving -------------------------
+
+def _solve_task(name, source, grid, full_stats, limits):
+    """
+    Solve one grid in a worker process.
+
+    Args:
+        name (str): Name of the grid.
+        source (str): Where the grid was read from.
+        grid (list): The grid rows.
+        full_stats (bool): Include every solve statistic in the record.
+        limits (dict): time_limit, node_limit and seed for CrosswordEngine.solve.
+
+    Returns:
+        dict: The JSON record for this grid.
+    """
+    record = {"name": name, "source": source}
+    try:
+        result = worker_engine().solve(grid, **limits)
+    except GridError as e:
+        record["error"] = str(e)
+        return record
+    except Exception as e:
+        # A malformed grid must not end the run for the grids after it
+        record["error"] = f"{type(e).__name__}: {e}"
+        return record
+    record.update({
+        "solved": result.solved,
+        "status": result.status,
+        "solution": result.solution,
+        "time": result.stats['total_time'],
+        "nodes": result.stats['recursive_calls'],
+        "fill_score": result.stats['fill_score'],
+        "seed": result.stats['seed'],
+    })
+    if full_stats:
+        record["stats"] = result.stats
+    return record
+
+
+def solve_grids(grids, words, workers, options, ordered=False, full_stats=False,
+                time_limit=None, node_limit=None, seed=None):
+    """
+    Solve grids in a process pool, yielding each record when it is ready.
+
+    At most two grids per worker are queued at a time, so inputs with
+    thousands of grids are never held in memory at once.
+
+    Args:
+        grids (iterable): (name, source, grid) tuples.
+        words (str): Path to the word list loaded by every worker.
+        workers (int): Number of processes.
+        options (dict): Keyword arguments for CrosswordEngine.
+        ordered (bool): Yield records in input order instead of as they finish.
+        full_stats (bool): Include every solve statistic in the records.
+        time_limit (float): Seconds allowed per grid; None for no limit.
+        node_limit (int): Search nodes allowed per grid; None for no limit.
+        seed (int): Seed used for every grid, making the run repeatable;
+            None gives each grid a fresh seed.
+
+    Yields:
+        dict: One record per grid.
+    """
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                             initargs=(words, None, None, options)) as executor:
+        limits = {"time_limit": time_limit, "node_limit": node_limit, "seed": seed}
+        pending = deque()
+        for name, source, grid in grids:
+            pending.append(executor.submit(_solve_task, name, source, grid, full_stats, limits))
+            if len(pending) >= 2 * workers:
+                yield next_record(pending, ordered)
+        while pending:
+            yield next_record(pending, ordered)
+
+
+def next_record(pending, ordered):
+    """
+    Wait for the next record to hand out.
+
+    Args:
+        pending (deque): Futures in submission order.
+        ordered (bool): Wait for the oldest future rather than any of them.
+
+    Returns:
+        dict: The record of the finished grid.
+    """
+    if ordered:
+        return pending.popleft().result()
+    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+    future = next(iter(done))
+    pending.remove(future)
+    return future.result()
+
+
+# ------------------------- Command Line -------------------------
+
+def build_parser():
+    """
+    Describe the command-line interface.
+
+    Returns:
+        argparse.ArgumentParser: The parser.
+    """
+    parser = argparse.ArgumentParser(
+        description="Fill crossword grids in bulk and print one JSON result per line.")
+    parser.add_argument("inputs", nargs="*", default=["-"],
+                        help="grid files or directories; '-' or nothing reads stdin")
+    parser.add_argument("--words", default=DEFAULT_WORDS,
+                        help="word list or compiled dictionary (default: Data/Words.txt)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="number of worker processes (default: CPU count)")
+    parser.add_argument("--ordered", action="store_true",
+                        help="print results in input order instead of as they finish")
+    parser.add_argument("--stats", action="store_true",
+                        help="include every solve statistic in the results")
+    parser.add_argument("--time-limit", type=float,
+                        help="seconds allowed per grid before it is reported as a timeout")
+    parser.add_argument("--node-limit", type=int,
+                        help="search nodes allowed per grid")
+    parser.add_argument("--seed", type=int,
+                        help="seed every solve for repeatable results")
+    parser.add_argument("--min-score", type=int, default=0,
+                        help="ignore words scoring below this")
+    parser.add_argument("--variable-heuristic", choices=VARIABLE_HEURISTICS, default="mrv")
+    parser.add_argument("--value-randomization", choices=VALUE_RANDOMIZATIONS, default="bucket")
+    parser.add_argument("--restart-strategy", choices=RESTART_STRATEGIES, default="luby")
+    return parser
+
+
+def main(argv=None):
+    """
+    Run the batch solver.
+
+    Args:
+        argv (list): Command-line arguments; defaults to sys.argv[1:].
+
+    Returns:
+        int: Exit status; 1 if any input or grid could not be processed.
+    """
+    args = build_parser().parse_args(argv)
+    options = {
+        "min_score": args.min_score,
+        "variable_heuristic": args.variable_heuristic,
+        "value_randomization": args.value_randomization,
+        "restart_strategy": args.restart_strategy,
+    }
+    status = 0
+    try:
+        records = solve_grids(read_grids(args.inputs), args.words, max(1, args.workers),
+                              options, ordered=args.ordered, full_stats=args.stats,
+                              time_limit=args.time_limit, node_limit=args.node_limit,
+                              seed=args.seed)
+        for record in records:
+            if "error" in record:
+                status = 1
+            print(json.dumps(record), flush=True)
+    except (OSError, ValueError, BrokenProcessPool) as e:
+        print(json.dumps({"error": str(e)}), flush=True)
+        status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
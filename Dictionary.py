@@ -0,0 +1,349 @@
+"""
+Compiled word lists.
+
+Reading a text word list means upper-casing, validating and indexing every
+word each time the engine starts. compile_word_list does that work once and
+writes a binary dictionary; CompiledDictionary maps the file into memory and
+only decodes the word table and letter bitsets of a length when a grid first
+asks for it, so a fresh worker process is ready almost immediately.
+
+File layout (little-endian):
+    header       magic, number of word lengths
+    frequencies  26 x u64 letter counts, A to Z
+    directory    per length: u32 length, u32 word count, u64 section offset
+    sections     per length: the words packed back to back as ASCII, an i16
+                 score per word, one u32 mask per position of the letters
+                 present there, then a (count + 7) // 8 byte bitset for
+                 every present letter of every position, in position then
+                 alphabet order
+
+Usage:
+    python Dictionary.py Data/Words.txt Data/Words.dict
+"""
+import argparse
+import mmap
+import struct
+import sys
+from array import array
+from collections import Counter
+from collections.abc import Mapping, Sequence
+
+MAGIC = b"CWDICT02"  # The last two digits are the format version
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+# Score given to words listed without one
+DEFAULT_SCORE = 50
+
+# Range of the i16 score stored for every word
+MIN_SCORE = -(1 << 15)
+MAX_SCORE = (1 << 15) - 1
+
+HEADER = struct.Struct("<8sI")
+FREQUENCIES = struct.Struct(f"<{len(ALPHABET)}Q")
+ENTRY = struct.Struct("<IIQ")
+
+
+def is_compiled(path):
+    """
+    Check whether a file is a compiled dictionary.
+
+    Args:
+        path (str): Path to the file.
+
+    Returns:
+        bool: True if the file starts with the compiled dictionary magic,
+            whatever its format version.
+    """
+    with open(path, 'rb') as f:
+        return f.read(len(MAGIC))[:-2] == MAGIC[:-2]
+
+
+def pack_bits(indices, size):
+    """
+    Pack word indices into a little-endian bitset of whole bytes.
+
+    Args:
+        indices (list): Positions of the set bits.
+        size (int): Number of words in the table.
+
+    Returns:
+        bytearray: The bitset, (size + 7) // 8 bytes long.
+    """
+    buffer = bytearray((size + 7) // 8)
+    for index in indices:
+        buffer[index >> 3] |= 1 << (index & 7)
+    return buffer
+
+
+def compile_section(words, scores, length):
+    """
+    Encode the words of one length with their scores and letter index.
+
+    Args:
+        words (list): Upper-case ASCII words, all of the given length.
+        scores (list): Score of each word.
+        length (int): The word length.
+
+    Returns:
+        bytes: The section as stored in the file.
+    """
+    masks = []
+    bitsets = []
+    for pos in range(length):
+        letter_ids = {}
+        for word_id, word in enumerate(words):
+            letter_ids.setdefault(word[pos], []).append(word_id)
+        mask = 0
+        for bit, letter in enumerate(ALPHABET):
+            if letter in letter_ids:
+                mask |= 1 << bit
+                bitsets.append(pack_bits(letter_ids[letter], len(words)))
+        masks.append(mask)
+    return b"".join([
+        "".join(words).encode("ascii"),
+        struct.pack(f"<{len(scores)}h", *scores),
+        struct.pack(f"<{length}I", *masks),
+        *bitsets,
+    ])
+
+
+def compile_word_list(words, path, scores=None):
+    """
+    Write a word list to disk as a compiled dictionary.
+
+    Words keep their relative order within each length, so the word tables
+    match the ones CrosswordEngine.set_words builds from the same list.
+
+    Args:
+        words (list): Words to compile.
+        path (str): Destination file.
+        scores (list): Optional score of each word; defaults to
+            DEFAULT_SCORE for every word.
+
+    Raises:
+        ValueError: If a word is not made of the letters A to Z, or its
+            score is outside MIN_SCORE..MAX_SCORE.
+    """
+    if scores is None:
+        scores = [DEFAULT_SCORE] * len(words)
+    tables = {}
+    score_tables = {}
+    for word, score in zip(words, scores):
+        word = word.upper()
+        if not (word.isascii() and word.isalpha()):
+            raise ValueError(f"Cannot compile {word!r}: only the letters A-Z are supported.")
+        if not MIN_SCORE <= score <= MAX_SCORE:
+            raise ValueError(f"Cannot compile {word!r}: its score {score} is outside "
+                             f"{MIN_SCORE}..{MAX_SCORE}.")
+        tables.setdefault(len(word), []).append(word)
+        score_tables.setdefault(len(word), []).append(score)
+
+    frequencies = Counter("".join("".join(table) for table in tables.values()))
+    sections = [(length, len(tables[length]),
+                 compile_section(tables[length], score_tables[length], length))
+                for length in sorted(tables)]
+
+    offset = HEADER.size + FREQUENCIES.size + ENTRY.size * len(sections)
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, len(sections)))
+        f.write(FREQUENCIES.pack(*(frequencies[letter] for letter in ALPHABET)))
+        for length, count, data in sections:
+            f.write(ENTRY.pack(length, count, offset))
+            offset += len(data)
+        for _, _, data in sections:
+            f.write(data)
+
+
+class LengthTable(Mapping):
+    """
+    Read-only mapping from word length to data decoded on first access.
+    """
+
+    def __init__(self, lengths, build):
+        """
+        Args:
+            lengths (iterable): The word lengths present in the dictionary.
+            build (callable): Decodes the value for one length.
+        """
+        self.lengths = sorted(lengths)
+        self.build = build
+        self.cache = {}
+
+    def __getitem__(self, length):
+        if length not in self.cache:
+            if length not in self.lengths:
+                raise KeyError(length)
+            self.cache[length] = self.build(length)
+        return self.cache[length]
+
+    def __iter__(self):
+        return iter(self.lengths)
+
+    def __len__(self):
+        return len(self.lengths)
+
+
+class WordList(Sequence):
+    """
+    Every word of a compiled dictionary, shortest words first.
+    """
+
+    def __init__(self, dictionary):
+        """
+        Args:
+            dictionary (CompiledDictionary): The dictionary to list.
+        """
+        self.dictionary = dictionary
+
+    def __len__(self):
+        return sum(count for count, _ in self.dictionary.sections.values())
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+        if index < 0:
+            index += len(self)
+        for length, (count, _) in self.dictionary.sections.items():
+            if 0 <= index < count:
+                return self.dictionary.word_tables[length][index]
+            index -= count
+        raise IndexError("word index out of range")
+
+    def __iter__(self):
+        for length in self.dictionary.sections:
+            yield from self.dictionary.word_tables[length]
+
+
+class CompiledDictionary:
+    """
+    A compiled dictionary mapped into memory.
+
+    word_tables, word_scores, letter_index and full_domains have the same
+    shape as the CrosswordEngine attributes of the same names, but each
+    length is only decoded when it is first looked up.
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str): Path to a file written by compile_word_list.
+
+        Raises:
+            ValueError: If the file is not a compiled dictionary or uses
+                another format version.
+        """
+        with open(path, 'rb') as f:
+            self.buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self.buffer) < HEADER.size:
+            raise ValueError(f"{path} is not a compiled dictionary.")
+        magic, count = HEADER.unpack_from(self.buffer, 0)
+        if magic[:-2] != MAGIC[:-2]:
+            raise ValueError(f"{path} is not a compiled dictionary.")
+        if magic != MAGIC:
+            raise ValueError(f"{path} was compiled in an older format; compile it again.")
+
+        offset = HEADER.size
+        counts = FREQUENCIES.unpack_from(self.buffer, offset)
+        self.letter_frequencies = Counter(
+            {letter: n for letter, n in zip(ALPHABET, counts) if n})
+        offset += FREQUENCIES.size
+
+        self.sections = {}  # length -> (word count, section offset)
+        for _ in range(count):
+            length, words, start = ENTRY.unpack_from(self.buffer, offset)
+            self.sections[length] = (words, start)
+            offset += ENTRY.size
+
+        self.word_tables = LengthTable(self.sections, self.read_words)
+        self.word_scores = LengthTable(self.sections, self.read_scores)
+        self.letter_index = LengthTable(self.sections, self.read_letter_index)
+        self.full_domains = LengthTable(
+            self.sections, lambda length: (1 << self.sections[length][0]) - 1)
+        self.words = WordList(self)
+
+    def read_words(self, length):
+        """
+        Decode the word table for one length.
+
+        Args:
+            length (int): The word length.
+
+        Returns:
+            list: The words, in table order.
+        """
+        count, start = self.sections[length]
+        packed = self.buffer[start:start + count * length].decode("ascii")
+        return [packed[i:i + length] for i in range(0, len(packed), length)]
+
+    def read_scores(self, length):
+        """
+        Decode the word scores for one length.
+
+        Args:
+            length (int): The word length.
+
+        Returns:
+            array: Signed 16-bit scores parallel to the word table.
+        """
+        count, start = self.sections[length]
+        offset = start + count * length
+        scores = array('h', self.buffer[offset:offset + 2 * count])
+        if sys.byteorder == "big":
+            scores.byteswap()
+        return scores
+
+    def read_letter_index(self, length):
+        """
+        Decode the positional letter bitsets for one length.
+
+        Args:
+            length (int): The word length.
+
+        Returns:
+            list: One dict per position mapping letters to bitsets.
+        """
+        count, start = self.sections[length]
+        size = (count + 7) // 8
+        offset = start + count * length + 2 * count
+        masks = struct.unpack_from(f"<{length}I", self.buffer, offset)
+        offset += 4 * length
+        positions = []
+        for mask in masks:
+            letters = {}
+            for bit, letter in enumerate(ALPHABET):
+                if mask >> bit & 1:
+                    letters[letter] = int.from_bytes(
+                        self.buffer[offset:offset + size], "little")
+                    offset += size
+            positions.append(letters)
+        return positions
+
+    def close(self):
+        """
+        Unmap the file.
+        """
+        self.buffer.close()
+
+
+def main():
+    """
+    Compile a text word list from the command line.
+    """
+    # Imported here because Engine itself imports this module
+    from Engine import read_word_list
+
+    parser = argparse.ArgumentParser(description="Compile a word list for fast loading.")
+    parser.add_argument("source", help="text word list, one word per line")
+    parser.add_argument("destination", help="compiled dictionary to write")
+    args = parser.parse_args()
+
+    try:
+        words, scores = read_word_list(args.source)
+        compile_word_list(words, args.destination, scores)
+    except (OSError, ValueError) as e:
+        sys.exit(f"Error: {e}")
+    print(f"Compiled {len(words)} words into {args.destination}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1892 @@
+"""
+Headless crossword solving engine.
+
+The engine has no GUI dependencies: give it a grid and a word list and it
+returns the filled slots together with solve statistics. The Tk application
+in Generator.py is a thin client of this module.
+"""
+import heapq
+import json
+import logging
+import math
+import os
+import random
+import re
+import time
+from array import array
+from collections import Counter, OrderedDict, deque
+from contextlib import contextmanager
+
+from Dictionary import DEFAULT_SCORE, MAX_SCORE, MIN_SCORE, CompiledDictionary, is_compiled
+
+logger = logging.getLogger(__name__)
+
+# Variable ordering heuristics accepted by CrosswordEngine
+VARIABLE_HEURISTICS = ("mrv", "dom/wdeg")
+
+# How order_domain_values randomizes candidates of equal quality
+VALUE_RANDOMIZATIONS = ("none", "bucket", "full")
+
+# Restart schedules accepted by CrosswordEngine
+RESTART_STRATEGIES = ("none", "luby", "geometric")
+
+# Outcomes reported in SolveResult.status
+SOLVE_STATUSES = ("solved", "unsatisfiable", "timeout", "node_limit", "cancelled")
+
+# Word list loaded by the command-line tools and the server when none is given
+DEFAULT_WORDS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Data", "Words.txt")
+
+# Used when no word list can be found on disk
+FALLBACK_WORDS = ["LASER", "SAILS", "SHEET", "STEER",
+                  "HEEL", "HIKE", "KEEL", "KNOT"]
+
+
+class GridError(ValueError):
+    """
+    Raised when a grid cannot be handed to the solver.
+    """
+
+
+class SolveResult:
+    """
+    Outcome of a single solve.
+
+    Attributes:
+        solved (bool): True if every slot was filled.
+        solution (dict): Mapping of slot names to words.
+        slots (dict): Mapping of slot names to their cell positions.
+        stats (dict): Timings and counters collected while solving; partial
+            when the search was stopped early.
+        status (str): One of SOLVE_STATUSES. "unsatisfiable" means the whole
+            search space was exhausted; "timeout", "node_limit" and
+            "cancelled" mean the search was stopped before it could tell.
+    """
+
+    def __init__(self, solved, solution, slots, stats, status=None):
+        self.solved = solved
+        self.solution = solution
+        self.slots = slots
+        self.stats = stats
+        self.status = status or ("solved" if solved else "unsatisfiable")
+
+    def to_dict(self):
+        """
+        Convert the result into JSON-serialisable primitives.
+
+        Returns:
+            dict: The result as plain dictionaries and lists.
+        """
+        return {
+            "solved": self.solved,
+            "status": self.status,
+            "solution": dict(self.solution),
+            "slots": {slot: [list(pos) for pos in positions]
+                      for slot, positions in self.slots.items()},
+            "stats": dict(self.stats),
+        }
+
+
+class NogoodStore:
+    """
+    Bounded store of partial assignments known to have no completion.
+
+    A nogood is a frozenset of (slot, word) pairs, and it matches any
+    assignment that contains all of its pairs. Each nogood is indexed under
+    every one of its pairs, so a check only looks at the nogoods that mention
+    the pair assigned last. Entries are evicted least recently used first
+    once the store is full, so search memory stays flat however long a solve
+    runs.
+    """
+
+    def __init__(self, capacity=100000):
+        """
+        Args:
+            capacity (int): Maximum number of nogoods kept.
+        """
+        self.capacity = capacity
+        self.entries = OrderedDict()
+        self.watches = {}  # (slot, word) -> nogoods containing that pair
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def check(self, assignment, pair):
+        """
+        Find a recorded nogood that an assignment contains.
+
+        Only nogoods containing pair are considered, so the caller checks
+        after each new assignment with the pair it just made; nogoods
+        without it were already ruled out at an earlier node.
+
+        Args:
+            assignment (dict): Current variable assignments.
+            pair (tuple): The (slot, word) assigned last.
+
+        Returns:
+            frozenset: The matching nogood, or None.
+        """
+        for key in self.watches.get(pair, ()):
+            if all(assignment.get(slot) == word for slot, word in key):
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return key
+        self.misses += 1
+        return None
+
+    def add(self, key):
+        """
+        Record a failing partial assignment, evicting the oldest if full.
+
+        Args:
+            key (frozenset): The (slot, word) pairs that cannot all hold.
+        """
+        if self.capacity <= 0 or not key:
+            return
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            return
+        self.entries[key] = None
+        for pair in key:
+            self.watches.setdefault(pair, set()).add(key)
+        if len(self.entries) > self.capacity:
+            oldest, _ = self.entries.popitem(last=False)
+            for pair in oldest:
+                watchers = self.watches[pair]
+                watchers.discard(oldest)
+                if not watchers:
+                    del self.watches[pair]
+            self.evictions += 1
+
+    def clear(self):
+        """
+        Drop all nogoods and reset the counters.
+        """
+        self.entries.clear()
+        self.watches.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        """
+        Get the store's counters.
+
+        Returns:
+            dict: Hit, miss and eviction counts and the current size.
+        """
+        return {
+            'nogood_hits': self.hits,
+            'nogood_misses': self.misses,
+            'nogood_evictions': self.evictions,
+            'nogoods': len(self.entries),
+        }
+
+
+class SearchStats:
+    """
+    Phase timers and hot-path counters of one solve.
+
+    The counters are plain attributes so the search can bump them with a
+    single increment; as_dict and to_json export them together with the
+    phase times.
+
+    Attributes:
+        revisions (int): Arcs revised by AC-3.
+        ac3_prunings (int): Words AC-3 removed from domains.
+        prunings (int): Domains narrowed by forward checking.
+        wipeouts (int): Values rejected because they would empty a
+            neighbor's domain, by forward checking or while ordering values.
+        max_depth (int): Deepest search stack reached.
+        phase_times (dict): Seconds spent in each of PHASES.
+    """
+
+    PHASES = ("slot_generation", "constraint_generation", "domain_setup", "ac3", "search")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """
+        Zero every counter and timer.
+        """
+        self.revisions = 0
+        self.ac3_prunings = 0
+        self.prunings = 0
+        self.wipeouts = 0
+        self.max_depth = 0
+        self.phase_times = {phase: 0.0 for phase in self.PHASES}
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Add the time spent in a block to one of PHASES.
+
+        Args:
+            name (str): The phase being timed.
+        """
+        start = time.time()
+        try:
+            yield
+        finally:
+            self.phase_times[name] += time.time() - start
+
+    def as_dict(self):
+        """
+        Get the counters and phase times.
+
+        Returns:
+            dict: Counter values and a 'phase_times' mapping.
+        """
+        return {
+            'revisions': self.revisions,
+            'ac3_prunings': self.ac3_prunings,
+            'prunings': self.prunings,
+            'wipeouts': self.wipeouts,
+            'max_depth': self.max_depth,
+            'phase_times': dict(self.phase_times),
+        }
+
+    def to_json(self, path):
+        """
+        Write the counters and phase times to a JSON file.
+
+        Args:
+            path (str): Destination file.
+        """
+        with open(path, 'w') as f:
+            json.dump(self.as_dict(), f, indent=2)
+
+
+def luby(i):
+    """
+    Get the i-th term of the Luby sequence 1, 1, 2, 1, 1, 2, 4, 1, ...
+
+    Args:
+        i (int): 1-based index into the sequence.
+
+    Returns:
+        int: The term.
+    """
+    k = 1
+    while (1 << k) - 1 < i:
+        k += 1
+    while i != (1 << k) - 1:
+        i -= (1 << (k - 1)) - 1
+        k = 1
+        while (1 << k) - 1 < i:
+            k += 1
+    return 1 << (k - 1)
+
+
+def check_number(name, value, minimum=None, integer=False):
+    """
+    Validate a numeric search option.
+
+    Args:
+        name (str): Option name, used in the error message.
+        value: The value given.
+        minimum (float): Smallest value allowed, or None for no bound.
+        integer (bool): Require an int rather than any real number.
+
+    Returns:
+        The value, unchanged.
+
+    Raises:
+        ValueError: If the value has the wrong type or is out of range.
+    """
+    kinds = int if integer else (int, float)
+    if isinstance(value, bool) or not isinstance(value, kinds):
+        kind = "an integer" if integer else "a number"
+        raise ValueError(f"{name} must be {kind}, not {value!r}")
+    if minimum is not None and not value >= minimum:
+        raise ValueError(f"{name} must be at least {minimum}, not {value}")
+    return value
+
+
+def check_flag(name, value):
+    """
+    Validate an on/off search option.
+
+    Args:
+        name (str): Option name, used in the error message.
+        value: The value given.
+
+    Returns:
+        bool: The value, unchanged.
+
+    Raises:
+        ValueError: If the value is not a bool.
+    """
+    if not isinstance(value, bool):
+        raise ValueError(f"{name} must be true or false, not {value!r}")
+    return value
+
+
+def normalize_grid(grid):
+    """
+    Convert a grid into a list of rows of single-token strings.
+
+    Accepts lists of lists, tuples or NumPy string arrays. Cells are stripped so
+    padded layouts such as the ones in Puzzles/grids.txt (" # ", "10 ") work.
+
+    Args:
+        grid: The crossword grid.
+
+    Returns:
+        list: The grid as a list of lists of strings.
+    """
+    rows = []
+    for row in grid:
+        rows.append([str(cell).strip().upper() or " " for cell in row])
+    if rows and any(len(row) != len(rows[0]) for row in rows):
+        raise GridError("All grid rows must have the same length.")
+    return rows
+
+
+def bits_from_indices(indices, size):
+    """
+    Build a bitset with the given bit indices set.
+
+    Args:
+        indices (iterable): Bit positions to set.
+        size (int): Number of bits in the set.
+
+    Returns:
+        int: The bitset.
+    """
+    buffer = bytearray((size + 7) // 8)
+    for index in indices:
+        buffer[index >> 3] |= 1 << (index & 7)
+    return int.from_bytes(buffer, "little")
+
+
+def bit_indices(bits):
+    """
+    List the positions of the set bits in a bitset, lowest first.
+
+    Args:
+        bits (int): The bitset.
+
+    Returns:
+        list: Indices of the set bits.
+    """
+    digits = bin(bits)[:1:-1]  # Least significant bit first, without "0b"
+    indices = []
+    index = digits.find("1")
+    while index != -1:
+        indices.append(index)
+        index = digits.find("1", index + 1)
+    return indices
+
+
+def read_word_list(path):
+    """
+    Read a word list from disk, one word per line.
+
+    A line may carry an integer score after a semicolon ("WORD;score"), as
+    in the lists constructors share; words without one get DEFAULT_SCORE.
+    Scores must lie in MIN_SCORE..MAX_SCORE, the range a word table stores.
+
+    Args:
+        path (str): Path to the word list.
+
+    Returns:
+        tuple: (words, scores), the upper-cased words and a parallel list
+            of their scores.
+
+    Raises:
+        ValueError: If a word is not alphabetic or its score is not an
+            integer in range.
+    """
+    words = []
+    scores = []
+    with open(path, 'r') as f:
+        for line in f:
+            word, _, score = line.strip().partition(';')
+            word = word.strip().upper()
+            if not word:
+                continue
+            if not word.isalpha():
+                raise ValueError(
+                    "File contains invalid words. Ensure all entries are alphabetic.")
+            try:
+                value = int(score) if score.strip() else DEFAULT_SCORE
+            except ValueError:
+                raise ValueError(f"Invalid score for {word}: {score.strip()!r}") from None
+            if not MIN_SCORE <= value <= MAX_SCORE:
+                raise ValueError(f"Score for {word} is outside {MIN_SCORE}..{MAX_SCORE}: {value}")
+            scores.append(value)
+            words.append(word)
+    return words, scores
+
+
+class CrosswordEngine:
+    """
+    Constraint-satisfaction solver for crossword grids.
+
+    Words are grouped into one table per length and a slot's domain is a
+    bitset (a Python int) over the table for its length: bit i is set when
+    word_length_cache[length][i] is still a candidate. letter_index holds,
+    for every length, position and letter, the bitset of words with that
+    letter at that position, so pruning a domain is a single AND.
+    """
+
+    def __init__(self, words=None, status_callback=None, debug=False,
+                 progress_callback=None, progress_interval=0.1, nogood_capacity=100000, variable_heuristic="mrv",
+                 value_randomization="bucket", restart_strategy="luby",
+                 restart_base=100, restart_factor=1.5, backjumping=True,
+                 decompose=True, min_score=0, score_weight=0.1):
+        """
+        Args:
+            words (list): Optional word list to load immediately.
+            status_callback (callable): Receives human-readable progress messages.
+            debug (bool): Emit debug messages through the logging module.
+            progress_callback (callable): Receives a snapshot of the partial
+                solution, mapping slots to words, at most once every
+                progress_interval seconds while the search runs.
+            progress_interval (float): Seconds between progress snapshots.
+            nogood_capacity (int): Maximum number of failing partial
+                assignments remembered during a solve; 0 disables the store.
+            variable_heuristic (str): "mrv" orders slots by domain size then
+                degree; "dom/wdeg" divides the domain size by the slot's
+                conflict-weighted degree.
+            value_randomization (str): "none" keeps the least-constraining
+                order, "bucket" shuffles values whose scores fall in the same
+                power-of-two bucket and "full" ignores the scores entirely.
+            restart_strategy (str): "luby" or "geometric" restart the search
+                after a growing number of backtracks, keeping conflict weights
+                and nogoods; "none" runs a single attempt.
+            restart_base (int): Backtracks allowed in the first attempt; at least 1.
+            restart_factor (float): Growth of the cutoff per attempt for the
+                geometric schedule; greater than 1.
+            backjumping (bool): Jump back to the cause of a dead end
+                (conflict-directed backjumping) instead of the previous slot.
+            decompose (bool): Search independent regions of the grid one at a
+                time instead of as one problem.
+            min_score (int): Words scoring below this are never used.
+            score_weight (float): Bits of least-constraining score a word
+                gains per point of its own score, so higher-scoring words
+                are tried first; 0 orders by constrainedness alone.
+
+        Raises:
+            ValueError: If an option has the wrong type or an out-of-range value.
+        """
+        self.DEBUG = debug
+        self.status_callback = status_callback
+        self.progress_callback = progress_callback
+        self.progress_interval = progress_interval
+        self.progress_due = 0.0  # time.monotonic() value of the next progress snapshot
+        self.recursive_calls = 0  # Count recursive calls
+        self.nogoods = NogoodStore()
+        self.search_stats = SearchStats()  # Phase timers and counters of the last solve
+        self.cancel_event = None  # Optional threading/multiprocessing Event
+        self.deadline = None  # time.monotonic() value at which the solve times out
+        self.node_limit = None  # Maximum recursive_calls for the solve
+        self.stop_reason = None  # Status of the last search stopped by a limit
+        self.seed = None  # Seed of the current solve
+        self.rng = random.Random()  # Per-solve source of all search randomness
+        self.configure(nogood_capacity=nogood_capacity,
+                       variable_heuristic=variable_heuristic,
+                       value_randomization=value_randomization,
+                       restart_strategy=restart_strategy,
+                       restart_base=restart_base,
+                       restart_factor=restart_factor,
+                       backjumping=backjumping,
+                       decompose=decompose,
+                       min_score=min_score,
+                       score_weight=score_weight)
+
+        # Word data
+        self.words = []  # Word list
+        self.word_length_cache = {}  # Cache for words by length
+        self.word_scores = {}  # length -> array of scores parallel to word_length_cache
+        self.eligible_cache = {}  # (length, min_score) -> bitset of words meeting it
+        self.letter_index = {}  # length -> position -> letter -> bitset
+        self.full_domains = {}  # length -> bitset of every word of that length
+        self.letter_frequencies = Counter()
+        self.dictionary = None  # CompiledDictionary backing the tables, if any
+
+        # Per-solve data structures
+        self.grid = []  # The crossword grid
+        self.slots = {}  # Slots with positions
+        self.constraints = {}  # Constraints between slots
+        self.solution = {}  # Final solution mapping slots to words
+        self.domains = {}  # Bitset of possible words for each slot
+        self.support_counts = {}  # slot -> crossing index -> letter -> count
+        self.trail = []  # (slot, previous domain) entries undone on backtrack
+        self.assignment = {}  # Current partial assignment of the search
+        self.stack = []  # Search frames: [slot, values, next index, trail mark, conflicts]
+        self.past_fc = {}  # slot -> assigned slots whose words pruned its domain, in order
+        self.wipeout = None  # Slot whose domain the last failed propagate emptied
+        self.ordering_conflicts = set()  # Slots that ruled out values in order_domain_values
+        self.expand_next = False  # True when the next step opens a new search node
+        self.search_result = None  # True/False once the search has finished
+        self.active_slots = []  # Slots filled by the current search
+        self.active_set = set()
+        self.components = []  # Independent groups of slots, solved one after another
+        self.component_index = 0  # Index of the component being searched
+        self.component_solution = {}  # Words of the components solved so far
+        self.backtracks = 0  # Values abandoned, used for restart cutoffs
+        self.restarts = 0  # Restarts taken by the current solve
+        self.backjumps = 0  # Frames skipped by conflict-directed backjumping
+        self.variable_queue = []  # Heap of (priority, version, slot) entries
+        self.queue_versions = {}  # slot -> version of its live heap entry
+        self.degrees = {}  # slot -> number of crossing slots
+        self.weights = {}  # slot -> conflict-weighted degree for dom/wdeg
+        self.cell_contents = {}  # Pre-filled letters in the grid
+
+        if words is not None:
+            self.set_words(words)
+
+    def configure(self, nogood_capacity=None, variable_heuristic=None,
+                  value_randomization=None, restart_strategy=None,
+                  restart_base=None, restart_factor=None, backjumping=None,
+                  decompose=None, min_score=None, score_weight=None):
+        """
+        Change search options between solves; None leaves an option as is.
+
+        Args:
+            nogood_capacity (int): See __init__.
+            variable_heuristic (str): See __init__.
+            value_randomization (str): See __init__.
+            restart_strategy (str): See __init__.
+            restart_base (int): See __init__.
+            restart_factor (float): See __init__.
+            backjumping (bool): See __init__.
+            decompose (bool): See __init__.
+            min_score (int): See __init__.
+            score_weight (float): See __init__.
+
+        Raises:
+            ValueError: If an option has the wrong type or an out-of-range value.
+        """
+        if variable_heuristic is not None:
+            if variable_heuristic not in VARIABLE_HEURISTICS:
+                raise ValueError(f"Unknown variable heuristic: {variable_heuristic}")
+            self.variable_heuristic = variable_heuristic
+        if value_randomization is not None:
+            if value_randomization not in VALUE_RANDOMIZATIONS:
+                raise ValueError(f"Unknown value randomization: {value_randomization}")
+            self.value_randomization = value_randomization
+        if nogood_capacity is not None:
+            self.nogoods.capacity = check_number("nogood_capacity", nogood_capacity, 0, True)
+        if restart_strategy is not None:
+            if restart_strategy not in RESTART_STRATEGIES:
+                raise ValueError(f"Unknown restart strategy: {restart_strategy}")
+            self.restart_strategy = restart_strategy
+        if restart_base is not None:
+            self.restart_base = check_number("restart_base", restart_base, 1, True)
+        if restart_factor is not None:
+            check_number("restart_factor", restart_factor)
+            if not restart_factor > 1:
+                # A constant cutoff could restart forever on a grid with no solution
+                raise ValueError(f"restart_factor must be greater than 1, not {restart_factor}")
+            self.restart_factor = restart_factor
+        if backjumping is not None:
+            self.backjumping = check_flag("backjumping", backjumping)
+        if decompose is not None:
+            self.decompose = check_flag("decompose", decompose)
+        if min_score is not None:
+            self.min_score = check_number("min_score", min_score, integer=True)
+        if score_weight is not None:
+            self.score_weight = check_number("score_weight", score_weight, 0)
+
+    def debug_log(self, message, *args):
+        """
+        Log debug messages if DEBUG is True.
+
+        The message is only formatted when the logger would emit it, so
+        with debug logging off a call costs a flag and a level check.
+
+        Args:
+            message (str): The message to log.
+            *args: Additional arguments to format into the message.
+        """
+        if self.DEBUG and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(message.format(*args) if args else message)
+
+    def report(self, message):
+        """
+        Forward a progress message to the status callback, if any.
+
+        Args:
+            message (str): The message to report.
+        """
+        if self.status_callback:
+            self.status_callback(message)
+        self.debug_log(message)
+
+    # ------------------------- Word Loading and Caching -------------------------
+
+    def load_words(self, path):
+        """
+        Load words from a text word list or a compiled dictionary.
+
+        Args:
+            path (str): Path to the word list; files written by
+                Dictionary.compile_word_list are memory-mapped instead of parsed.
+        """
+        if is_compiled(path):
+            self.set_dictionary(CompiledDictionary(path))
+        else:
+            self.set_words(*read_word_list(path))
+        self.debug_log("Words loaded: {}", len(self.words))
+
+    def set_words(self, words, scores=None):
+        """
+        Replace the word list and rebuild the derived caches.
+
+        Args:
+            words (list): Words to use for filling slots.
+            scores (list): Optional score of each word; defaults to
+                DEFAULT_SCORE for every word.
+        """
+        self.dictionary = None
+        self.words = [word.upper() for word in words]
+        self.cache_words_by_length(scores)
+        self.build_letter_index()
+        self.calculate_letter_frequencies()
+
+    def set_dictionary(self, dictionary):
+        """
+        Use the tables of a compiled dictionary instead of building them.
+
+        Args:
+            dictionary (CompiledDictionary): The memory-mapped dictionary.
+        """
+        self.dictionary = dictionary
+        self.words = dictionary.words
+        self.word_length_cache = dictionary.word_tables
+        self.letter_index = dictionary.letter_index
+        self.full_domains = dictionary.full_domains
+        self.word_scores = dictionary.word_scores
+        self.eligible_cache = {}
+        self.letter_frequencies = dictionary.letter_frequencies
+
+    def cache_words_by_length(self, scores=None):
+        """
+        Cache words by their length for efficient domain setup.
+
+        Args:
+            scores (list): Optional score of each word in self.words.
+        """
+        if scores is None:
+            scores = [DEFAULT_SCORE] * len(self.words)
+        self.word_length_cache = {}
+        self.word_scores = {}
+        self.eligible_cache = {}
+        for word, score in zip(self.words, scores):
+            length = len(word)
+            self.word_length_cache.setdefault(length, []).append(word)
+            self.word_scores.setdefault(length, array('h')).append(score)
+        self.debug_log("Word length cache created.")
+
+    def build_letter_index(self):
+        """
+        Precompute the (length, position, letter) -> bitset index.
+        """
+        self.letter_index = {}
+        self.full_domains = {}
+        for length, words in self.word_length_cache.items():
+            positions = []
+            for pos in range(length):
+                letter_ids = {}
+                for word_id, word in enumerate(words):
+                    letter_ids.setdefault(word[pos], []).append(word_id)
+                positions.append({letter: bits_from_indices(ids, len(words))
+                                  for letter, ids in letter_ids.items()})
+            self.letter_index[length] = positions
+            self.full_domains[length] = (1 << len(words)) - 1
+        self.debug_log("Letter index created.")
+
+    def letter_bits(self, slot, idx, letter):
+        """
+        Get the bitset of words for a slot that have a letter at an index.
+
+        Args:
+            slot (str): The slot identifier.
+            idx (int): Position within the slot.
+            letter (str): The letter to match.
+
+        Returns:
+            int: Bitset over the word table for the slot's length.
+        """
+        return self.length_index(len(self.slots[slot]))[idx].get(letter, 0)
+
+    def length_index(self, length):
+        """
+        Get the per-position letter bitsets for a word length.
+
+        Args:
+            length (int): The word length.
+
+        Returns:
+            list: One dict per position mapping letters to bitsets; every
+                dict is empty when the word list has no words of that length.
+        """
+        positions = self.letter_index.get(length)
+        if positions is None:
+            return [{}] * length
+        return positions
+
+    def pattern_bits(self, pattern):
+        """
+        Look up the words matching a pattern such as "A..LE".
+
+        Fixed letters are intersected through the letter index, so the cost
+        depends on the number of fixed letters rather than the word count.
+        Words scoring below min_score are left out.
+
+        Args:
+            pattern (str): Letters and "." wildcards.
+
+        Returns:
+            int: Bitset over the word table for the pattern's length.
+        """
+        length = len(pattern)
+        positions = self.letter_index.get(length)
+        if positions is None:
+            return 0
+        bits = self.eligible_bits(length)
+        for pos, letter in enumerate(pattern.upper()):
+            if letter != '.':
+                bits &= positions[pos].get(letter, 0)
+                if not bits:
+                    break
+        return bits
+
+    def eligible_bits(self, length):
+        """
+        Get the bitset of words of a length that meet the minimum score.
+
+        Args:
+            length (int): The word length.
+
+        Returns:
+            int: Bitset over the word table for that length.
+        """
+        key = (length, self.min_score)
+        if key not in self.eligible_cache:
+            scores = self.word_scores[length]
+            self.eligible_cache[key] = bits_from_indices(
+                [i for i, score in enumerate(scores) if score >= self.min_score],
+                len(scores))
+        return self.eligible_cache[key]
+
+    def word_score(self, word):
+        """
+        Look up the score of a word.
+
+        Args:
+            word (str): The word.
+
+        Returns:
+            int: Its score, or None if the word is not in the list.
+        """
+        indices = bit_indices(self.pattern_bits(word))
+        return self.word_scores[len(word)][indices[0]] if indices else None
+
+    def match_pattern(self, pattern):
+        """
+        List the words matching a pattern such as "A..LE".
+
+        Args:
+            pattern (str): Letters and "." wildcards.
+
+        Returns:
+            list: Matching words, in word table order.
+        """
+        words = self.word_length_cache.get(len(pattern), [])
+        return [words[i] for i in bit_indices(self.pattern_bits(pattern))]
+
+    def domain_words(self, slot, domain=None):
+        """
+        Decode a slot's domain bitset into its words.
+
+        Args:
+            slot (str): The slot identifier.
+            domain (int): Bitset to decode; defaults to the slot's current domain.
+
+        Returns:
+            list: Candidate words, in word table order.
+        """
+        if domain is None:
+            domain = self.domains[slot]
+        words = self.word_length_cache.get(len(self.slots[slot]), [])
+        return [words[i] for i in bit_indices(domain)]
+
+    def calculate_letter_frequencies(self):
+        """
+        Precompute letter frequencies across the word list.
+        """
+        all_letters = "".join(self.words)
+        self.letter_frequencies = Counter(all_letters)
+
+    # ------------------------- Solving Methods -------------------------
+
+    def solve(self, grid, slots=None, time_limit=None, node_limit=None, seed=None):
+        """
+        Fill a grid with words from the loaded word list.
+
+        The search stops early when time_limit or node_limit runs out or
+        cancel_event is set; the result then carries a "timeout",
+        "node_limit" or "cancelled" status with the stats gathered so far.
+        A given seed, grid, word list and set of options always produce the
+        same search.
+
+        Args:
+            grid: The crossword grid, using "#" for blocks, digits for numbered
+                cells, letters for pre-filled cells and " " for open cells.
+            slots (list): Optional subset of slot names to fill; the other
+                slots are left empty but every one of them crossing the
+                subset keeps at least one candidate. Used to hand
+                independent components of one grid to different processes.
+            time_limit (float): Seconds allowed for the solve; None for no limit.
+            node_limit (int): Search nodes allowed for the solve; None for no limit.
+            seed (int): Seed for the solve's random choices; None draws a
+                fresh one, which is reported in the stats as 'seed'.
+
+        Returns:
+            SolveResult: The solution and statistics for this solve.
+
+        Raises:
+            GridError: If the grid is empty or has no numbered slots.
+        """
+        start_time = time.time()
+        self.set_limits(time_limit, node_limit)
+        self.seed_rng(seed)
+
+        self.prepare(grid)
+        self.plan_components(slots)
+        return self.finish_search(start_time)
+
+    def resume(self, path, time_limit=None, node_limit=None):
+        """
+        Continue a search saved with save_checkpoint.
+
+        Args:
+            path (str): Path to the checkpoint file.
+            time_limit (float): Seconds allowed for this run; None for no limit.
+            node_limit (int): Total search nodes allowed, counting the ones
+                made before the checkpoint; None for no limit.
+
+        Returns:
+            SolveResult: The solution and statistics for the resumed search.
+        """
+        start_time = time.time()
+        self.set_limits(time_limit, node_limit)
+        self.load_checkpoint(path)
+        return self.finish_search(start_time)
+
+    def seed_rng(self, seed=None):
+        """
+        Start a fresh random number generator for a solve.
+
+        Every random choice of the search goes through self.rng, so engines
+        sharing a process do not disturb each other's sequences.
+
+        Args:
+            seed (int): The seed; None draws one from the operating system.
+        """
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(32)
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.report(f"Random seed: {seed}")
+
+    def set_limits(self, time_limit=None, node_limit=None):
+        """
+        Arm the time and node limits for the next search.
+
+        Args:
+            time_limit (float): Seconds from now; None for no limit.
+            node_limit (int): Maximum recursive_calls; None for no limit.
+        """
+        self.deadline = None if time_limit is None else time.monotonic() + time_limit
+        self.node_limit = node_limit
+        self.stop_reason = None
+
+    def check_limits(self):
+        """
+        Check whether the search has to stop before it is finished.
+
+        Returns:
+            str: "cancelled", "timeout" or "node_limit", or None to go on.
+        """
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            return "cancelled"
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            return "timeout"
+        if self.node_limit is not None and self.recursive_calls >= self.node_limit:
+            return "node_limit"
+        return None
+
+    def prepare(self, grid):
+        """
+        Build slots, constraints and arc-consistent domains for a grid.
+
+        Args:
+            grid: The crossword grid.
+
+        Raises:
+            GridError: If the grid is empty or has no numbered slots.
+        """
+        self.grid = normalize_grid(grid)
+        if not self.grid or not self.grid[0]:
+            raise GridError("The grid is empty. Please generate or load a grid.")
+
+        self.search_stats.reset()
+        self.solution = {}
+        self.generate_slots()
+        if not self.slots:
+            raise GridError("No numbered slots found to solve.")
+
+        self.report("Running AC-3 algorithm...")
+
+        with self.search_stats.phase("ac3"):
+            ac3_result = self.ac3()
+        self.ac3_time = self.search_stats.phase_times["ac3"]
+
+        has_empty_domain = any(
+            domain == 0 for domain in self.domains.values())
+
+        if not ac3_result or has_empty_domain:
+            self.report(
+                "AC-3 failed or domains wiped out. Attempting backtracking...")
+        else:
+            self.report("Starting backtracking search...")
+
+        self.initial_domain_sizes = self.domain_sizes()
+        self.report("Domain Sizes After Setup:")
+        for slot, domain_size in self.initial_domain_sizes.items():
+            self.report(f"Domain for {slot} has {domain_size} options.")
+
+    def finish_search(self, start_time):
+        """
+        Run the prepared search to completion and package the outcome.
+
+        Args:
+            start_time (float): When the solve started, for the total time.
+
+        Returns:
+            SolveResult: The solution and statistics.
+        """
+        backtracking_start = time.time()
+        while True:
+            if self.restart_strategy == "none":
+                result = self.run_search()
+            else:
+                result = self.run_with_restarts()
+            if not result:
+                break
+            self.component_solution.update(self.solution)
+            self.component_index += 1
+            if self.component_index >= len(self.components):
+                break
+            self.start_search(self.components[self.component_index])
+        backtracking_time = time.time() - backtracking_start
+        self.search_stats.phase_times["search"] += backtracking_time
+
+        if result:
+            self.solution = dict(self.component_solution)
+
+        stats = {
+            'slots': len(self.slots),
+            'components': len(self.components),
+            'domain_sizes': self.initial_domain_sizes,
+            'ac3_time': self.ac3_time,
+            'backtracking_time': backtracking_time,
+            'recursive_calls': self.recursive_calls,
+            'backtracks': self.backtracks,
+            'restarts': self.restarts,
+            'backjumps': self.backjumps,
+            'seed': self.seed,
+            'total_time': time.time() - start_time,
+            'fill_score': self.fill_score() if result else None,
+        }
+        stats.update(self.search_stats.as_dict())
+        stats.update(self.nogoods.stats())
+        if result is None:
+            status = self.stop_reason or "cancelled"
+            self.report(f"Search stopped ({status}) after {self.recursive_calls} nodes.")
+        else:
+            status = None
+        return SolveResult(bool(result), dict(self.solution) if result else {},
+                           dict(self.slots), stats, status)
+
+    def fill_score(self):
+        """
+        Average the scores of the words in the solution.
+
+        Returns:
+            float: Mean word score, or None for an empty solution.
+        """
+        scores = [self.word_score(word) for word in self.solution.values()]
+        scores = [score for score in scores if score is not None]
+        return sum(scores) / len(scores) if scores else None
+
+    def generate_slots(self):
+        """
+        Identify all slots in the grid and generate constraints.
+        """
+        slot_start = time.time()
+        self.slots.clear()
+        self.domains.clear()
+        self.cell_contents.clear()
+
+        rows, cols = len(self.grid), len(self.grid[0])
+
+        # Record pre-filled letters and numbered cells
+        for r in range(rows):
+            for c in range(cols):
+                cell = self.grid[r][c]
+                key = f"{r},{c}"
+                if cell.isalpha():
+                    self.cell_contents[key] = cell
+                elif cell != "#" and cell.strip() != "":
+                    self.cell_contents[key] = None
+
+        # Identify slots
+        for r in range(rows):
+            for c in range(cols):
+                cell = self.grid[r][c]
+                if cell.isdigit():
+                    if c == 0 or self.grid[r][c - 1] == "#":
+                        positions = self.get_slot_positions(r, c, "across")
+                        if len(positions) >= 2:
+                            slot_name = f"{cell}ACROSS"
+                            self.slots[slot_name] = positions
+                    if r == 0 or self.grid[r - 1][c] == "#":
+                        positions = self.get_slot_positions(r, c, "down")
+                        if len(positions) >= 2:
+                            slot_name = f"{cell}DOWN"
+                            self.slots[slot_name] = positions
+
+        stats = self.search_stats
+        stats.phase_times["slot_generation"] += time.time() - slot_start
+        with stats.phase("constraint_generation"):
+            self.generate_constraints()
+        with stats.phase("domain_setup"):
+            self.setup_domains()
+
+    def get_slot_positions(self, r, c, direction):
+        """
+        Get the positions of cells in a slot starting from (r, c).
+
+        Args:
+            r (int): Row index.
+            c (int): Column index.
+            direction (str): 'across' or 'down'.
+
+        Returns:
+            list: Positions in the slot.
+        """
+        positions = []
+        rows, cols = len(self.grid), len(self.grid[0])
+
+        while r < rows and c < cols and self.grid[r][c] != "#":
+            positions.append((r, c))
+            if direction == "across":
+                c += 1
+            else:
+                r += 1
+
+        return positions
+
+    def generate_constraints(self):
+        """
+        Generate constraints between overlapping slots.
+        """
+        self.constraints.clear()
+        position_map = {}
+
+        for slot, positions in self.slots.items():
+            for idx, pos in enumerate(positions):
+                key = f"{pos[0]},{pos[1]}"
+                position_map.setdefault(key, []).append({'slot': slot, 'idx': idx})
+
+        for overlaps in position_map.values():
+            if len(overlaps) > 1:
+                for i in range(len(overlaps)):
+                    for j in range(i + 1, len(overlaps)):
+                        slot1 = overlaps[i]['slot']
+                        idx1 = overlaps[i]['idx']
+                        slot2 = overlaps[j]['slot']
+                        idx2 = overlaps[j]['idx']
+
+                        self.constraints.setdefault(slot1, {}).setdefault(slot2, []).append((idx1, idx2))
+                        self.constraints.setdefault(slot2, {}).setdefault(slot1, []).append((idx2, idx1))
+
+    def setup_domains(self):
+        """
+        Set up the domains for each slot based on possible words and pre-filled letters.
+        """
+        self.domains.clear()
+        for slot, positions in self.slots.items():
+            pattern = ''.join(
+                self.cell_contents.get(f"{r},{c}") or '.' for r, c in positions
+            )
+            self.domains[slot] = self.pattern_bits(pattern)
+
+    def domain_sizes(self):
+        """
+        Get the current domain size of every slot, ordered by clue number.
+
+        Returns:
+            dict: Mapping of slot names to domain sizes.
+        """
+        return {slot: self.domains[slot].bit_count()
+                for slot in sorted(self.domains.keys(), key=slot_sort_key)}
+
+    def ac3(self):
+        """
+        Enforce arc consistency using per-cell letter support counts.
+
+        For every crossing cell, support_counts[slot][idx][letter] counts the
+        candidates of slot with that letter at idx. A word is removed from a
+        crossing slot as soon as its letter at the shared cell has no support
+        left on the other side, so revising an arc costs one AND per letter
+        instead of comparing every pair of words.
+
+        Returns:
+            bool: True if arc consistency is achieved, False otherwise.
+        """
+        self.init_support_counts()
+        queue = deque(self.constraints)
+        queued = set(queue)
+
+        while queue:
+            var2 = queue.popleft()
+            queued.discard(var2)
+            for var1 in self.constraints[var2]:
+                if self.revise(var1, var2):
+                    if not self.domains[var1]:
+                        return False  # Domain wiped out, no solution
+                    if var1 not in queued:
+                        queue.append(var1)
+                        queued.add(var1)
+        return True
+
+    def init_support_counts(self):
+        """
+        Count the letters of every slot's candidates at each crossing cell.
+        """
+        self.support_counts = {}
+        for slot, neighbors in self.constraints.items():
+            counts = {}
+            for overlaps in neighbors.values():
+                for idx, _ in overlaps:
+                    if idx not in counts:
+                        counts[idx] = self.letter_counts(slot, idx)
+            self.support_counts[slot] = counts
+
+    def letter_counts(self, slot, idx):
+        """
+        Count how many candidates of a slot have each letter at an index.
+
+        Args:
+            slot (str): The slot identifier.
+            idx (int): Position within the slot.
+
+        Returns:
+            dict: Mapping of letters to candidate counts; letters with no
+                candidates are left out.
+        """
+        domain = self.domains[slot]
+        counts = {}
+        for letter, bits in self.length_index(len(self.slots[slot]))[idx].items():
+            count = (domain & bits).bit_count()
+            if count:
+                counts[letter] = count
+        return counts
+
+    def revise(self, var1, var2):
+        """
+        Revise the domain of var1 to ensure consistency with var2.
+
+        Args:
+            var1 (str): Variable to revise.
+            var2 (str): Variable to check against.
+
+        Returns:
+            bool: True if the domain was revised, False otherwise.
+        """
+        domain = self.domains[var1]
+        for idx1, idx2 in self.constraints[var1][var2]:
+            supported = self.support_counts[var2][idx2]
+            for letter in self.support_counts[var1][idx1]:
+                if letter not in supported:
+                    domain &= ~self.letter_bits(var1, idx1, letter)
+
+        self.search_stats.revisions += 1
+        removed = self.domains[var1] & ~domain
+        if not removed:
+            return False
+        self.search_stats.ac3_prunings += removed.bit_count()
+        self.domains[var1] = domain
+        self.remove_support(var1, removed)
+        return True
+
+    def remove_support(self, slot, removed):
+        """
+        Decrement the support counts of a slot for words removed from its domain.
+
+        Args:
+            slot (str): The slot identifier.
+            removed (int): Bitset of the removed words.
+        """
+        positions = self.length_index(len(self.slots[slot]))
+        for idx, counts in self.support_counts[slot].items():
+            for letter in list(counts):
+                lost = (removed & positions[idx][letter]).bit_count()
+                if lost:
+                    counts[letter] -= lost
+                    if not counts[letter]:
+                        del counts[letter]
+
+    def find_components(self, slots):
+        """
+        Split slots into groups that share no cells with each other.
+
+        Slots in different components never constrain each other, so each
+        component can be searched on its own and the solutions combined; the
+        search cost becomes a sum over the components instead of a product.
+
+        Args:
+            slots (iterable): The slots to split.
+
+        Returns:
+            list: Lists of slot names, largest component first.
+        """
+        wanted = set(slots)
+        components = []
+        seen = set()
+        for slot in self.slots:
+            if slot not in wanted or slot in seen:
+                continue
+            component = []
+            queue = deque([slot])
+            seen.add(slot)
+            while queue:
+                current = queue.popleft()
+                component.append(current)
+                for neighbor in self.constraints.get(current, {}):
+                    if neighbor in wanted and neighbor not in seen:
+                        seen.add(neighbor)
+                        queue.append(neighbor)
+            components.append(component)
+        components.sort(key=len, reverse=True)
+        return components
+
+    def plan_components(self, slots=None):
+        """
+        Decide which slots to fill and reset the search to the first component.
+
+        Args:
+            slots (list): Subset of slot names to fill; None fills every slot.
+
+        Raises:
+            GridError: If a requested slot does not exist in the grid.
+        """
+        if slots is None:
+            slots = list(self.slots)
+        unknown = [slot for slot in slots if slot not in self.slots]
+        if unknown:
+            raise GridError(f"Unknown slots: {', '.join(unknown)}")
+
+        if self.decompose:
+            self.components = self.find_components(slots)
+        else:
+            self.components = [list(slots)] if slots else []
+        if len(self.components) > 1:
+            self.report(f"Solving {len(self.components)} independent regions separately.")
+        self.component_index = 0
+        self.component_solution = {}
+        self.reset_counters()
+        self.start_search(self.components[0] if self.components else [])
+
+    def backtracking_solve(self):
+        """
+        Backtracking search with heuristics and nogood recording.
+
+        Returns:
+            bool: True if a solution is found, False otherwise.
+        """
+        self.reset_counters()
+        self.start_search()
+        return self.run_search()
+
+    def reset_counters(self):
+        """
+        Zero the search counters and forget recorded nogoods.
+        """
+        self.recursive_calls = 0
+        self.backtracks = 0
+        self.restarts = 0
+        self.backjumps = 0
+        self.nogoods.clear()
+
+    def start_search(self, slots=None):
+        """
+        Reset the search state so the next step opens the root node.
+
+        Args:
+            slots (list): Slots to fill in this search; defaults to all of them.
+        """
+        self.active_slots = list(self.slots) if slots is None else list(slots)
+        self.active_set = set(self.active_slots)
+        self.trail = []
+        self.past_fc = {slot: [] for slot in self.slots}
+        self.assignment = {}
+        self.stack = []
+        self.expand_next = True
+        self.search_result = None
+        self.init_variable_queue()
+
+    def restart(self):
+        """
+        Abandon the current attempt and reopen the root node.
+
+        Conflict weights and recorded nogoods are kept, so the next attempt
+        starts from what this one learned.
+        """
+        self.restore_domains(0)
+        self.assignment = {}
+        self.stack = []
+        self.expand_next = True
+        self.restarts += 1
+        self.init_variable_queue(reset_weights=False)
+
+    def restart_cutoff(self, attempt):
+        """
+        Get the backtrack budget of an attempt under the restart schedule.
+
+        Args:
+            attempt (int): 1-based attempt number.
+
+        Returns:
+            int: Backtracks allowed before restarting; at least the attempt
+                number, so the cutoff keeps growing and the search stays
+                complete even while a small factor rounds down.
+        """
+        if self.restart_strategy == "luby":
+            cutoff = self.restart_base * luby(attempt)
+        else:
+            cutoff = int(self.restart_base * self.restart_factor ** (attempt - 1))
+        return max(attempt, cutoff)
+
+    def run_with_restarts(self):
+        """
+        Run the search in attempts capped by the restart schedule.
+
+        Returns:
+            bool or None: True if solved, False if an attempt exhausted the
+                search space, None if a limit stopped the search.
+        """
+        attempt = 1
+        while True:
+            cutoff = self.backtracks + self.restart_cutoff(attempt)
+            result = self.run_search(max_backtracks=cutoff)
+            if result is not None:
+                return result
+            if self.stop_reason is not None:
+                return None
+            self.debug_log("Restarting after {} backtracks.", self.backtracks)
+            self.restart()
+            attempt += 1
+
+    def run_search(self, max_steps=None, max_backtracks=None):
+        """
+        Step the search until it finishes or a step budget runs out.
+
+        The search keeps its frames on self.stack rather than the Python call
+        stack, so a run that stops on max_steps can be continued later with
+        another call, or saved with save_checkpoint. The run also stops when
+        check_limits reports a reason, which is stored in self.stop_reason;
+        the node limit is checked every step and the clock and cancel_event
+        every 1024 steps. With a progress_callback set, the clock is also
+        read every 64 steps to sample the partial solution, so the callback
+        costs nothing per node and runs at most once per progress_interval.
+
+        Args:
+            max_steps (int): Maximum number of steps to take; None for no limit.
+            max_backtracks (int): Stop once self.backtracks reaches this value.
+
+        Returns:
+            bool or None: True if solved, False if the search space is
+                exhausted, None if a budget or limit ran out first.
+        """
+        step = self.step
+        node_limit = self.node_limit
+        progress = self.progress_callback
+        steps = 0
+        while self.search_result is None:
+            if max_steps is not None and steps >= max_steps:
+                return None
+            if max_backtracks is not None and self.backtracks >= max_backtracks:
+                return None
+            if not steps & 1023 or node_limit is not None:
+                reason = self.check_limits()
+                if reason is not None:
+                    self.stop_reason = reason
+                    self.debug_log("Search stopped ({}) after {} steps.", reason, steps)
+                    return None
+            if progress is not None and not steps & 63 and time.monotonic() >= self.progress_due:
+                self.progress_due = time.monotonic() + self.progress_interval
+                progress(self.partial_solution())
+            step()
+            steps += 1
+        return self.search_result
+
+    def partial_solution(self):
+        """
+        Get the words placed so far, including those of solved components.
+
+        Returns:
+            dict: A new mapping of slot names to words.
+        """
+        return {**self.component_solution, **self.assignment}
+
+    def step(self):
+        """
+        Advance the search by one unit of work.
+
+        A step either opens a new node (selecting a variable and ordering its
+        values) or tries values of the deepest open node until one propagates
+        cleanly or the node is exhausted.
+
+        With backjumping enabled the search is FC-CBJ: every frame collects a
+        conflict set of earlier slots whose words caused its values to fail,
+        and an exhausted node jumps straight back to the deepest slot in its
+        conflict set instead of to its parent.
+
+        Returns:
+            bool or None: The search result once finished, None otherwise.
+        """
+        if self.search_result is not None:
+            return self.search_result
+
+        assignment = self.assignment
+        stack = self.stack
+
+        if self.expand_next:
+            self.expand_next = False
+            if len(assignment) == len(self.active_slots):
+                self.solution = assignment.copy()
+                self.search_result = True
+                return True
+
+            self.recursive_calls += 1
+
+            if stack:
+                # Only nogoods containing the newest assignment can have started to match
+                last = stack[-1][0]
+                nogood = self.nogoods.check(assignment, (last, assignment[last]))
+                if nogood is not None:
+                    self.backjump({slot for slot, _ in nogood})
+                    return None
+
+            var_to_assign = self.select_unassigned_variable(assignment)
+            if var_to_assign:
+                values = self.order_domain_values(var_to_assign, assignment)
+                conflicts = set()
+                for neighbor in self.ordering_conflicts:
+                    conflicts.update(self.past_fc[neighbor])
+                stack.append([var_to_assign, values, 0, len(self.trail), conflicts])
+                if len(stack) > self.search_stats.max_depth:
+                    self.search_stats.max_depth = len(stack)
+            return None
+
+        if not stack:
+            self.search_result = False
+            return False
+
+        frame = stack[-1]
+        var_to_assign, values, index, mark, conflicts = frame
+        if var_to_assign in assignment:
+            # The subtree below the current value failed
+            del assignment[var_to_assign]
+            self.restore_domains(mark)
+            self.backtracks += 1
+
+        while index < len(values):
+            value = values[index]
+            index += 1
+            if self.propagate(var_to_assign, value, assignment):
+                assignment[var_to_assign] = value
+                frame[2] = index
+                self.expand_next = True
+                return None
+            conflicts.update(self.past_fc[self.wipeout])
+            self.restore_domains(mark)
+            self.backtracks += 1
+
+        stack.pop()
+        self.push_variable(var_to_assign)  # Unassigned again; requeue it
+        conflicts.update(self.past_fc[var_to_assign])
+        conflicts.discard(var_to_assign)
+        # The words on the conflict set leave this slot no value, wherever they occur
+        self.nogoods.add(frozenset((slot, assignment[slot]) for slot in conflicts))
+        self.backjump(conflicts)
+        return None
+
+    def backjump(self, conflicts):
+        """
+        Unwind the stack to the deepest frame whose slot is in a conflict set.
+
+        Frames above it are abandoned without trying their remaining values,
+        since none of their slots contributed to the failure. The conflict set
+        is merged into the target frame's own. Without backjumping the target
+        is always the parent frame.
+
+        Args:
+            conflicts (set): Assigned slots responsible for the failure.
+        """
+        stack = self.stack
+        if not self.backjumping:
+            conflicts = set(self.assignment)
+        while stack and stack[-1][0] not in conflicts:
+            var, _, _, mark, _ = stack.pop()
+            self.assignment.pop(var, None)
+            self.restore_domains(mark)
+            self.push_variable(var)
+            self.backjumps += 1
+        if stack:
+            target = stack[-1]
+            target[4].update(conflicts)
+            target[4].discard(target[0])
+        else:
+            # No assignment is to blame, so the grid has no solution
+            self.search_result = False
+
+    def search_path(self):
+        """
+        Describe the open search frames, for stepping through a solve.
+
+        Returns:
+            list: One (slot, current value, values left) tuple per frame,
+                root first; the value is None while the slot is unassigned.
+        """
+        return [(frame[0], self.assignment.get(frame[0]), len(frame[1]) - frame[2])
+                for frame in self.stack]
+
+    def save_checkpoint(self, path):
+        """
+        Write the grid and search frames to a JSON file.
+
+        Domains and the trail are not stored; load_checkpoint rebuilds them
+        by preparing the grid again and replaying the assigned values. The
+        random generator state is stored, so resuming a checkpoint always
+        continues the same way, though not necessarily exactly as the
+        uninterrupted search would have.
+
+        Args:
+            path (str): Destination file.
+        """
+        checkpoint = {
+            'version': 4,
+            'grid': self.grid,
+            'components': self.components,
+            'component_index': self.component_index,
+            'component_solution': self.component_solution,
+            'frames': [[var, values, index, var in self.assignment, sorted(conflicts)]
+                       for var, values, index, _, conflicts in self.stack],
+            'expand_next': self.expand_next,
+            'recursive_calls': self.recursive_calls,
+            'weights': self.weights,
+            'seed': self.seed,
+            'rng_state': self.rng.getstate(),
+        }
+        with open(path, 'w') as f:
+            json.dump(checkpoint, f)
+
+    def load_checkpoint(self, path):
+        """
+        Restore a search written by save_checkpoint.
+
+        The engine must have the same word list loaded as when the
+        checkpoint was saved.
+
+        Args:
+            path (str): Checkpoint file.
+        """
+        with open(path) as f:
+            checkpoint = json.load(f)
+        if checkpoint.get('version') != 4:
+            raise ValueError(f"Unsupported checkpoint version in {path}")
+
+        version, internal_state, gauss_next = checkpoint['rng_state']
+        self.seed = checkpoint['seed']
+        self.rng = random.Random()
+        self.rng.setstate((version, tuple(internal_state), gauss_next))
+
+        self.prepare(checkpoint['grid'])
+        self.components = checkpoint['components']
+        self.component_index = checkpoint['component_index']
+        self.component_solution = checkpoint['component_solution']
+        self.reset_counters()
+        self.start_search(self.components[self.component_index])
+        self.weights.update(checkpoint['weights'])
+        for var, values, index, assigned, conflicts in checkpoint['frames']:
+            frame = [var, values, index, len(self.trail), set(conflicts)]
+            self.stack.append(frame)
+            if assigned:
+                value = values[index - 1]
+                if not self.propagate(var, value, self.assignment):
+                    raise ValueError(f"Checkpoint {path} does not match the loaded word list")
+                self.assignment[var] = value
+        self.expand_next = checkpoint['expand_next']
+        self.recursive_calls = checkpoint['recursive_calls']
+
+    def init_variable_queue(self, reset_weights=True):
+        """
+        Build the variable-ordering heap from the current domains.
+
+        Args:
+            reset_weights (bool): Reset conflict weights to the plain degrees.
+        """
+        self.degrees = {slot: len(self.constraints.get(slot, {})) for slot in self.slots}
+        if reset_weights:
+            self.weights = dict(self.degrees)
+        self.variable_queue = []
+        self.queue_versions = {}
+        for slot in self.active_slots:
+            self.push_variable(slot)
+
+    def variable_priority(self, slot):
+        """
+        Compute the heap priority of a slot; smaller is chosen first.
+
+        Args:
+            slot (str): The slot identifier.
+
+        Returns:
+            tuple: The priority, ending in a random tie-breaker.
+        """
+        size = self.domains[slot].bit_count()
+        if self.variable_heuristic == "dom/wdeg":
+            return (size / max(self.weights[slot], 1), self.rng.random())
+        return (size, -self.degrees[slot], self.rng.random())
+
+    def push_variable(self, slot):
+        """
+        Queue a slot with its current priority, superseding older entries.
+
+        Args:
+            slot (str): The slot identifier.
+        """
+        if slot not in self.active_set:
+            return  # Crosses the slots being filled but is not filled itself
+        version = self.queue_versions.get(slot, 0) + 1
+        self.queue_versions[slot] = version
+        heapq.heappush(self.variable_queue, (self.variable_priority(slot), version, slot))
+
+    def select_unassigned_variable(self, assignment):
+        """
+        Select the next unassigned variable using MRV and degree heuristics, with random tie-breaking.
+
+        Domain changes push a fresh heap entry for the slot, so this pops
+        entries until it finds one that is current instead of rescanning every
+        slot.
+
+        Args:
+            assignment (dict): Current variable assignments.
+
+        Returns:
+            str: The selected variable.
+        """
+        queue = self.variable_queue
+        if len(queue) > 8 * len(self.active_slots) + 64:
+            # Too many superseded entries; rebuild from the unassigned slots
+            self.variable_queue = queue = []
+            for slot in self.active_slots:
+                if slot not in assignment:
+                    self.push_variable(slot)
+
+        while queue:
+            _, version, slot = heapq.heappop(queue)
+            if slot not in assignment and self.queue_versions[slot] == version:
+                return slot
+        return None
+
+    def order_domain_values(self, variable, assignment):
+        """
+        Order the domain values for a variable using the Least Constraining Value heuristic.
+
+        A value's score is the sum over unassigned crossing slots of log2 of
+        how many of their candidates share its letter at the crossing cell,
+        plus score_weight times the word's own score from the word list.
+        The per-letter counts are computed once per call from the letter
+        index, so scoring a value is one table lookup per crossing. Values
+        that would leave a crossing slot with no candidates are dropped, and
+        the slots responsible are left in self.ordering_conflicts.
+
+        Args:
+            variable (str): The variable to order values for.
+            assignment (dict): Current variable assignments.
+
+        Returns:
+            list: Ordered list of domain values, least constraining first.
+        """
+        length = len(self.slots[variable])
+        words = self.word_length_cache.get(length, [])
+        word_scores = self.word_scores.get(length, [])
+        indices = bit_indices(self.domains[variable])
+        self.ordering_conflicts = set()
+        if self.value_randomization == "full":
+            values = [words[i] for i in indices]
+            self.rng.shuffle(values)
+            return values
+
+        # log2(support) per crossing cell and letter; missing letters have none
+        tables = []
+        for neighbor, overlaps in self.constraints.get(variable, {}).items():
+            if neighbor in assignment:
+                continue
+            for idx1, idx2 in overlaps:
+                tables.append((idx1, self.letter_log_supports(neighbor, idx2), neighbor))
+
+        scored = []
+        for i in indices:
+            value = words[i]
+            score = self.score_weight * word_scores[i]
+            for idx, table, neighbor in tables:
+                support = table.get(value[idx])
+                if support is None:
+                    self.ordering_conflicts.add(neighbor)
+                    break
+                score += support
+            else:
+                scored.append((score, value))
+        self.search_stats.wipeouts += len(indices) - len(scored)
+
+        if self.value_randomization == "bucket":
+            scored.sort(key=lambda item: (-math.floor(item[0]), self.rng.random()))
+        else:
+            scored.sort(key=lambda item: -item[0])
+        return [value for _, value in scored]
+
+    def letter_log_supports(self, slot, idx):
+        """
+        Get log2 of the candidate count of each letter at a position of a slot.
+
+        Args:
+            slot (str): The slot identifier.
+            idx (int): Position within the slot.
+
+        Returns:
+            dict: Mapping of letters to log2 counts; letters with no
+                candidates are left out.
+        """
+        return {letter: math.log2(count)
+                for letter, count in self.letter_counts(slot, idx).items()}
+
+    def propagate(self, variable, value, assignment):
+        """
+        Forward-check a candidate value in a single pass over the neighbors.
+
+        Each unassigned neighbor is filtered once and the filtered domain is
+        kept, recorded on the trail; the pass stops at the first wipeout. The
+        caller undoes the changes with restore_domains whether or not it
+        succeeds. Assigned neighbors need no check: their words already pruned
+        this variable's domain when they were assigned.
+
+        Args:
+            variable (str): The variable to assign.
+            value (str): The value to assign.
+            assignment (dict): Current variable assignments.
+
+        Returns:
+            bool: False if the value wipes out a neighbor's domain, True otherwise.
+        """
+        neighbors = self.constraints.get(variable)
+        if not neighbors:
+            return True
+
+        for neighbor in neighbors:
+            if neighbor not in assignment:
+                new_domain = self.domains[neighbor] & self.support_mask(variable, value, neighbor)
+                if not new_domain:
+                    self.wipeout = neighbor
+                    self.search_stats.wipeouts += 1
+                    self.record_conflict(variable, neighbor)
+                    return False  # Assignment invalidates neighbor's domain
+                self.set_domain(neighbor, new_domain, variable)
+        return True
+
+    def support_mask(self, variable, value, neighbor):
+        """
+        Get the bitset of neighbor words compatible with a value for a variable.
+
+        Args:
+            variable (str): The assigned variable.
+            value (str): The value assigned to it.
+            neighbor (str): A slot crossing the variable.
+
+        Returns:
+            int: Bitset of neighbor words that agree on every shared cell.
+        """
+        mask = self.full_domains.get(len(self.slots[neighbor]), 0)
+        for idx1, idx2 in self.constraints[variable][neighbor]:
+            mask &= self.letter_bits(neighbor, idx2, value[idx1])
+        return mask
+
+    def record_conflict(self, variable, neighbor):
+        """
+        Bump the weight of a constraint that caused a domain wipeout.
+
+        Args:
+            variable (str): The slot being assigned.
+            neighbor (str): The slot whose domain was wiped out.
+        """
+        self.weights[variable] += 1
+        self.weights[neighbor] += 1
+        if self.variable_heuristic == "dom/wdeg":
+            self.push_variable(neighbor)
+
+    def set_domain(self, slot, domain, pruner):
+        """
+        Replace a slot's domain, recording the old bitset on the trail.
+
+        Args:
+            slot (str): The slot identifier.
+            domain (int): The new domain bitset.
+            pruner (str): The assigned slot whose word caused the pruning.
+        """
+        old_domain = self.domains[slot]
+        if domain != old_domain:
+            self.search_stats.prunings += 1
+            self.trail.append((slot, old_domain))
+            self.domains[slot] = domain
+            self.past_fc[slot].append(pruner)
+            self.push_variable(slot)
+
+    def restore_domains(self, mark):
+        """
+        Undo domain changes back to a trail mark after backtracking.
+
+        Args:
+            mark (int): Trail length to unwind to.
+        """
+        trail = self.trail
+        domains = self.domains
+        past_fc = self.past_fc
+        while len(trail) > mark:
+            slot, domain = trail.pop()
+            domains[slot] = domain
+            past_fc[slot].pop()
+            self.push_variable(slot)
+
+
+def slot_sort_key(slot):
+    """
+    Sort key that orders slot names such as "12ACROSS" by clue number.
+
+    Args:
+        slot (str): The slot identifier.
+
+    Returns:
+        int: The clue number of the slot.
+    """
+    return int(re.match(r'\d+', slot).group())
@@ -1,46 +1,73 @@
 import tkinter as tk
 from tkinter import messagebox, simpledialog
-import random
 import re
 import time
 import numpy as np
-from collections import Counter
 import threading
 import logging
+import os
+import queue
+import argparse
 
-# Logging configuration
-logging.basicConfig(filename="debug.log", level=logging.DEBUG,
-                    format="%(asctime)s - %(levelname)s - %(message)s")
+from Engine import CrosswordEngine, FALLBACK_WORDS, GridError, slot_sort_key
+from Logs import start_logging, stop_logging
+from Portfolio import PortfolioSolver
+
+logger = logging.getLogger(__name__)
 
 class CrosswordSolver(tk.Tk):
     """
     Main application class for the Crossword Generator and Solver GUI.
+
+    Tk may only be touched from the main thread, so the solver thread never
+    updates widgets itself: it puts status lines and callbacks on ui_queue,
+    which drain_ui_queue applies in batches from the main loop.
     """
 
-    def __init__(self):
+    UI_POLL_MS = 50  # How often queued solver events are applied
+    UI_BATCH_LIMIT = 5000  # Most queued events applied per poll, so the UI stays responsive
+    MAX_STATUS_LINES = 2000  # Older status lines are dropped beyond this
+    CELL_SIZE = 30  # Side of a grid cell, in pixels
+    GRID_BORDER = 3  # Width of the frame drawn around the grid
+    BLACK = "#333"  # Fill of blacked-out cells
+
+    def __init__(self, debug=False):
+        """
+        Args:
+            debug (bool): Write debug messages from the GUI and the engine
+                to the log.
+        """
         super().__init__()
         self.title("Custom Crossword Generator")
         self.configure(bg="#f0f2f5")
 
         # Constants and configurations
-        self.DEBUG = True  # Toggle debug messages
-        self.word_length_cache = {}  # Cache for words by length
+        self.DEBUG = debug  # Toggle debug messages
         self.is_number_entry_mode = False  # Number entry mode flag
         self.is_letter_entry_mode = False  # Letter entry mode flag
         self.is_drag_mode = False  # Drag mode flag
         self.is_solving = False  # Prevent concurrent solving
-        self.recursive_calls = 0  # Count recursive calls
         self.performance_data = {}  # Store performance metrics
+        self.ui_queue = queue.Queue()  # ("status", message, clear) or ("call", func, args)
+        self.live_frame = None  # Newest partial solution from the solver, not yet drawn
+        self.live_shown = False  # The grid shows a partial solution rather than the puzzle
+
+        # Headless solver; the GUI only renders its results
+        self.engine = CrosswordEngine(status_callback=self.update_status, debug=self.DEBUG)
+        self.cancel_event = threading.Event()  # Set by the Stop button
+        self.engine.cancel_event = self.cancel_event
+        self.portfolio = None  # Process pool for parallel solving, started on first use
+        self.words_path = None  # File the word list came from, shared with the portfolio
 
         # Data structures
         self.grid = np.array([])  # The crossword grid
         self.words = []  # Word list
         self.slots = {}  # Slots with positions
-        self.constraints = {}  # Constraints between slots
         self.solution = {}  # Final solution mapping slots to words
-        self.domains = {}  # Possible words for each slot
-        self.cell_contents = {}  # Pre-filled letters in the grid
-        self.cells = {}  # GUI cell mapping
+        self.cells = {}  # (row, col) -> (rectangle id, text id) on the grid canvas
+        self.cell_states = {}  # (row, col) -> (text, bg, fg) as last drawn
+        self.last_drag_cell = None  # Cell the pointer was over at the last drag event
+        self.is_dragging = False  # A drag-mode stroke is in progress
 
         # Predefined puzzles
         self.predefined_puzzles = self.initialize_puzzles()
@@ -50,6 +77,7 @@ class CrosswordSolver(tk.Tk):
 
         # Load words
         self.after(0, self.load_words)
+        self.after(self.UI_POLL_MS, self.drain_ui_queue)
 
     # ------------------------- Initialization Methods -------------------------
 
@@ -117,13 +145,14 @@ class CrosswordSolver(tk.Tk):
         """
         Log debug messages if DEBUG is True.
 
+        The message is only formatted when the logger would emit it.
+
         Args:
             message (str): The message to log.
             *args: Additional arguments to format into the message.
         """
-        if self.DEBUG:
-            formatted_message = message.format(*args)
-            logging.debug(formatted_message)
+        if self.DEBUG and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(message.format(*args) if args else message)
 
     # ------------------------- UI Methods -------------------------
 
@@ -261,9 +290,14 @@ class CrosswordSolver(tk.Tk):
         tk.Label(self.grid_frame, text="Crossword Grid",
                 font=("Arial", 16), bg="#f0f2f5", fg="#333").pack()
 
-        self.grid_container = tk.Frame(
-            self.grid_frame, bg="#ffffff", bd=3, relief="solid")
-        self.grid_container.pack(expand=True, pady=10, padx=10)
+        # One canvas draws every cell; see build_grid_cells and update_cell
+        self.grid_canvas = tk.Canvas(
+            self.grid_frame, width=0, height=0, bg="#ffffff", bd=self.GRID_BORDER,
+            relief="solid", highlightthickness=0)
+        self.grid_canvas.pack(expand=True, pady=10, padx=10)
+        self.grid_canvas.bind("<ButtonPress-1>", self.grid_pressed)
+        self.grid_canvas.bind("<B1-Motion>", self.on_drag)
+        self.grid_canvas.bind("<ButtonRelease-1>", self.stop_drag)
 
         # Right Frame for Word Lists
         word_list_frame = tk.Frame(middle_frame, bg="#f0f2f5")
@@ -330,6 +364,26 @@ class CrosswordSolver(tk.Tk):
         self.solve_crossword_button.bind("<Enter>", lambda e: self.show_tooltip(
             e, "Start solving the crossword"))
 
+        self.stop_solving_button = tk.Button(controls_frame, text="Stop",
+                                             command=self.stop_solving, bg="#dc3545",
+                                             fg="#ffffff", font=("arial", 12, "bold"),
+                                             state="disabled")
+        self.stop_solving_button.pack(side="left", padx=5)
+
+        tk.Label(controls_frame, text="Time limit (s, 0 = none):", bg="#f0f2f5", fg="#333",
+                 font=("arial", 12)).pack(side="left", padx=5)
+        self.time_limit_var = tk.IntVar(value=60)
+        tk.OptionMenu(controls_frame, self.time_limit_var,
+                      0, 10, 30, 60, 120, 300).pack(side="left", padx=5)
+
+        self.parallel_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(controls_frame, text="Use all CPU cores", variable=self.parallel_var,
+                       bg="#f0f2f5", fg="#333", font=("arial", 12)).pack(side="left", padx=5)
+
+        self.live_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(controls_frame, text="Show search live", variable=self.live_var,
+                       bg="#f0f2f5", fg="#333", font=("arial", 12)).pack(side="left", padx=5)
+
         # Footer
         tk.Label(main_frame, text="© William Poston Crossword Generator",
                 font=("arial", 12), bg="#f0f2f5", fg="#555").pack(pady=10)
@@ -357,59 +411,106 @@ class CrosswordSolver(tk.Tk):
         event.widget.bind("<Leave>", hide_tooltip)
 
     def update_status(self, message, clear=False):
+        """
+        Queue a line for the status display; safe to call from any thread.
+
+        Args:
+            message (str): The line to show.
+            clear (bool): Empty the display first.
+        """
+        self.ui_queue.put(("status", message, clear))
+        self.debug_log(message)
+
+    def post(self, func, *args):
+        """
+        Run a function on the Tk main loop; safe to call from any thread.
+
+        Args:
+            func (callable): The function to run.
+            *args: Arguments for the function.
+        """
+        self.ui_queue.put(("call", func, args))
+
+    def drain_ui_queue(self):
+        """
+        Apply the status lines and callbacks queued since the last poll.
+
+        Runs on the main loop every UI_POLL_MS milliseconds. Consecutive
+        status lines are written with one insert, so a burst of progress
+        messages costs one widget update per poll instead of one per line.
+        Only the newest live frame is drawn; frames that arrived in between
+        are skipped.
+        """
+        frame, self.live_frame = self.live_frame, None
+        if frame is not None:
+            self.show_partial(frame)
+
+        lines = []
+        clear = False
+        try:
+            for _ in range(self.UI_BATCH_LIMIT):
+                kind, *payload = self.ui_queue.get_nowait()
+                if kind == "status":
+                    message, clear_first = payload
+                    if clear_first:
+                        lines, clear = [], True
+                    lines.append(message)
+                else:
+                    # Flush pending lines first so messages keep their order
+                    self.write_status(lines, clear)
+                    lines, clear = [], False
+                    func, args = payload
+                    func(*args)
+        except queue.Empty:
+            pass
+        finally:
+            self.write_status(lines, clear)
+            self.after(self.UI_POLL_MS, self.drain_ui_queue)
+
+    def write_status(self, lines, clear=False):
+        """
+        Append lines to the status display in a single widget update.
+
+        Args:
+            lines (list): Lines to append.
+            clear (bool): Empty the display first.
+        """
+        if not lines and not clear:
+            return
         self.status_display.config(state="normal")
         if clear:
             self.status_display.delete(1.0, tk.END)
-        self.status_display.insert(tk.END, message + "\n")
+        if lines:
+            self.status_display.insert(tk.END, "\n".join(lines) + "\n")
+        line_count = int(self.status_display.index("end-1c").split(".")[0])
+        if line_count > self.MAX_STATUS_LINES:
+            self.status_display.delete(1.0, f"{line_count - self.MAX_STATUS_LINES + 1}.0")
         self.status_display.see(tk.END)
         self.status_display.config(state="disabled")
-        self.debug_log(message)
 
     # ------------------------- Word Loading and Caching -------------------------
 
     def load_words(self):
         """
-        Load words from 'Words.txt' and cache them by length.
+        Load words into the solving engine, preferring a compiled 'Words.dict'
+        over 'Words.txt'.
         """
         try:
-            with open('Words.txt', 'r') as f:
-                self.words = [word.strip().upper()
-                              for word in f if word.strip()]
-            if not all(word.isalpha() for word in self.words):
-                raise ValueError(
-                    "File contains invalid words. Ensure all entries are alphabetic.")
-            self.cache_words_by_length()
-            self.calculate_letter_frequencies()
+            path = 'Words.dict' if os.path.exists('Words.dict') else 'Words.txt'
+            self.engine.load_words(path)
+            self.words_path = path
+            self.words = self.engine.words
             self.debug_log("Words loaded: {}", len(self.words))
         except FileNotFoundError:
             # Fallback word list
-            self.words = ["LASER", "SAILS", "SHEET", "STEER",
-                          "HEEL", "HIKE", "KEEL", "KNOT"]
+            self.engine.set_words(FALLBACK_WORDS)
+            self.words = self.engine.words
             messagebox.showwarning(
                 "Warning", "Words.txt not found. Using fallback word list.")
             self.debug_log("Words.txt not found. Using fallback word list.")
-            self.cache_words_by_length()
-            self.calculate_letter_frequencies()
         except Exception as e:
             messagebox.showerror("Error", f"Error loading words: {e}")
 
-    def cache_words_by_length(self):
-        """
-        Cache words by their length for efficient domain setup.
-        """
-        self.word_length_cache.clear()
-        for word in self.words:
-            length = len(word)
-            self.word_length_cache.setdefault(length, []).append(word)
-        self.debug_log("Word length cache created.")
-
-    def calculate_letter_frequencies(self):
-        """
-        Precompute letter frequencies across the word list.
-        """
-        all_letters = "".join(self.words)
-        self.letter_frequencies = Counter(all_letters)
-
     # ------------------------- Grid Management Methods -------------------------
 
     def generate_grid(self):
@@ -426,22 +527,7 @@ class CrosswordSolver(tk.Tk):
 
         # Clear any existing puzzle
         self.grid = np.full((rows, cols), "#", dtype=str)
-        self.cells = {}
-        self.grid_container.destroy()
-        self.grid_container = tk.Frame(
-            self.grid_frame, bg="#ffffff", bd=3, relief="solid")
-        self.grid_container.pack(pady=10)
-
-        # Create GUI cells
-        for r in range(rows):
-            for c in range(cols):
-                cell = tk.Label(self.grid_container, text="", width=2, height=1, bg="#333",
-                                fg="#333", bd=1, relief="solid", font=("Arial", 12, "bold"))
-                cell.grid(row=r, column=c)
-                cell.bind("<Button-1>", self.cell_clicked)
-                cell.row = r
-                cell.col = c
-                self.cells[(r, c)] = cell
+        self.build_grid_cells()
 
         self.debug_log("Grid generated with rows: {}, columns: {}", rows, cols)
 
@@ -462,50 +548,103 @@ class CrosswordSolver(tk.Tk):
         self.grid = []
         self.solution.clear()
         self.slots.clear()
-        self.constraints.clear()
-        self.domains.clear()
-        self.cell_contents.clear()
-
-        rows = len(puzzle['grid'])
-        cols = len(puzzle['grid'][0])
 
         # Deep copy to avoid modifying the original puzzle
         self.grid = np.array([row[:] for row in puzzle['grid']], dtype=str)
-        self.cells = {}
-        self.grid_container.destroy()
-        self.grid_container = tk.Frame(
-            self.grid_frame, bg="#ffffff", bd=3, relief="solid")
-        self.grid_container.pack(pady=10)
+        self.build_grid_cells()
+
+        self.debug_log("Loaded predefined puzzle: {}", puzzle_name)
 
-        # Create GUI cells with appropriate content
+    def build_grid_cells(self):
+        """
+        Redraw the grid canvas from scratch for the current self.grid.
+
+        Each cell is a rectangle and a text item on the one canvas; their ids
+        are kept in self.cells so later changes go through update_cell.
+        """
+        rows, cols = self.grid.shape
+        size = self.CELL_SIZE
+        origin = self.GRID_BORDER
+        self.grid_canvas.delete("all")
+        self.grid_canvas.config(width=cols * size, height=rows * size)
+        self.cells = {}
+        self.cell_states = {}
+        self.live_shown = False
         for r in range(rows):
             for c in range(cols):
-                cell_value = self.grid[r][c]
-                cell = tk.Label(self.grid_container, text="", width=2, height=1,
-                                bd=1, relief="solid", font=("Arial", 12, "bold"))
-
-                if cell_value == "#":
-                    cell.config(bg="#333", fg="#333")
-                elif cell_value.isdigit():
-                    cell.config(bg="#f8f9fa", fg="#000", text=cell_value)
-                elif cell_value.isalpha():
-                    cell.config(bg="#f8f9fa", fg="#000", text=cell_value)
-                else:
-                    cell.config(bg="#f8f9fa", fg="#444")
+                state = self.cell_state(self.grid[r][c])
+                x = origin + c * size
+                y = origin + r * size
+                rect = self.grid_canvas.create_rectangle(
+                    x, y, x + size, y + size, fill=state[1], outline="#000")
+                text = self.grid_canvas.create_text(
+                    x + size / 2, y + size / 2, text=state[0], fill=state[2],
+                    font=("Arial", 12, "bold"))
+                self.cells[(r, c)] = (rect, text)
+                self.cell_states[(r, c)] = state
 
-                cell.grid(row=r, column=c)
-                cell.bind("<Button-1>", self.cell_clicked)
-                cell.row = r
-                cell.col = c
-                self.cells[(r, c)] = cell
+    def cell_state(self, value):
+        """
+        Get how a cell of the puzzle is drawn.
 
-        self.debug_log("Loaded predefined puzzle: {}", puzzle_name)
+        Args:
+            value (str): The cell's entry in self.grid.
+
+        Returns:
+            tuple: (text, bg, fg) for update_cell.
+        """
+        if value == "#":
+            return "", self.BLACK, self.BLACK
+        if value.isdigit() or value.isalpha():
+            return value, "#f8f9fa", "#000"
+        return "", "#f8f9fa", "#444"
+
+    def cell_at(self, x, y):
+        """
+        Find the grid cell under a point of the canvas.
+
+        Args:
+            x (int): Horizontal position in canvas pixels.
+            y (int): Vertical position in canvas pixels.
+
+        Returns:
+            tuple: (row, col), or None if the point is outside the grid.
+        """
+        row = (y - self.GRID_BORDER) // self.CELL_SIZE
+        col = (x - self.GRID_BORDER) // self.CELL_SIZE
+        if (row, col) in self.cells:
+            return row, col
+        return None
+
+    def is_black(self, row, col):
+        """
+        Check whether a cell is drawn blacked out.
+
+        Args:
+            row (int): Row index.
+            col (int): Column index.
+
+        Returns:
+            bool: True for a black cell.
+        """
+        return self.cell_states[(row, col)][1] == self.BLACK
+
+    def grid_pressed(self, event):
+        """
+        Route a click on the grid canvas to the handler of the current mode.
+        """
+        if self.is_drag_mode:
+            self.start_drag(event)
+        else:
+            self.cell_clicked(event)
 
     def cell_clicked(self, event):
-        cell = event.widget
-        row, col = cell.row, cell.col
+        cell = self.cell_at(event.x, event.y)
+        if cell is None:
+            return
+        row, col = cell
 
-        if cell.cget("bg") == "#333":  # Blacked-out cells
+        if self.is_black(row, col):  # Blacked-out cells
             messagebox.showwarning("Warning", "This cell is blacked out and cannot be modified.")
             return
 
@@ -532,14 +671,10 @@ class CrosswordSolver(tk.Tk):
             # Drag Mode is active, so clicking does not toggle cells
             return
 
-        # Default Mode: Toggle between black and white
-        if cell.cget("bg") != "#333":
-            self.update_cell(row, col, value="", bg="#333", fg="#333")
-            self.grid[row][col] = "#"
-            self.update_numbers_after_removal(row, col)
-        else:
-            self.update_cell(row, col, value="", bg="#f8f9fa", fg="#444")
-            self.grid[row][col] = " "
+        # Default Mode: Toggle between black and white; black cells were refused above
+        self.update_cell(row, col, value="", bg=self.BLACK, fg=self.BLACK)
+        self.grid[row][col] = "#"
+        self.update_numbers_after_removal(row, col)
 
     def start_drag_mode(self):
         if self.is_number_entry_mode:
@@ -547,62 +682,37 @@ class CrosswordSolver(tk.Tk):
         if self.is_letter_entry_mode:
             self.start_letter_entry_mode()
         if self.is_drag_mode:
-            self.is_drag_mode = False
-            self.mode_label.config(text="Mode: Default")
-            self.update_status("Drag Mode Deactivated.")
-            self.debug_log("Drag mode stopped.")
-
-            # Unbind drag events
-            for cell in self.cells.values():
-                cell.unbind("<ButtonPress-1>")
-                cell.unbind("<B1-Motion>")
-                cell.unbind("<ButtonRelease-1>")
-
-                # Rebind cell click
-                cell.bind("<Button-1>", self.cell_clicked)
-
-            # Update button appearance
-            self.start_drag_mode_button.config(text="Drag Mode", bg="#0069d9")
+            self.stop_drag_mode()
         else:
+            # The canvas bindings check is_drag_mode, so nothing needs rebinding
             self.is_drag_mode = True
             self.mode_label.config(text="Mode: Drag")
             self.update_status("Drag Mode Activated.")
             self.debug_log("Drag mode started.")
 
-            # Bind drag events
-            for cell in self.cells.values():
-                cell.bind("<ButtonPress-1>", self.start_drag)
-                cell.bind("<B1-Motion>", self.on_drag)
-                cell.bind("<ButtonRelease-1>", self.stop_drag)
-
             # Update button appearance
             self.start_drag_mode_button.config(text="Exit Drag Mode", bg="#dc3545")
 
     def stop_drag_mode(self):
         self.is_drag_mode = False
+        self.is_dragging = False
         self.mode_label.config(text="Mode: Default")
         self.update_status("Drag Mode Deactivated.")
         self.debug_log("Drag mode stopped.")
 
-        # Unbind drag events
-        for cell in self.cells.values():
-            cell.unbind("<ButtonPress-1>")
-            cell.unbind("<B1-Motion>")
-            cell.unbind("<ButtonRelease-1>")
-
-            # Rebind cell click
-            cell.bind("<Button-1>", self.cell_clicked)
-
         # Update button appearance
         self.start_drag_mode_button.config(text="Drag Mode", bg="#0069d9")
 
     def start_drag(self, event):
         if not self.is_drag_mode:
             return
-        cell = event.widget
-        row, col = cell.row, cell.col
+        cell = self.cell_at(event.x, event.y)
+        if cell is None:
+            return
+        row, col = cell
         self.is_dragging = True
-        if cell.cget("bg") == "#333":
+        self.last_drag_cell = cell
+        if self.is_black(row, col):
             self.toggle_to_black = False  # We're turning cells white
         else:
             self.toggle_to_black = True  # We're turning cells black
@@ -611,33 +721,35 @@ class CrosswordSolver(tk.Tk):
     def on_drag(self, event):
         if not self.is_dragging or not self.is_drag_mode:
             return
-        x = self.grid_container.winfo_pointerx() - self.grid_container.winfo_rootx()
-        y = self.grid_container.winfo_pointery() - self.grid_container.winfo_rooty()
-        widget = event.widget.winfo_containing(event.x_root, event.y_root)
-        if widget in self.cells.values():
-            cell = widget
-            row = cell.row
-            col = cell.col
-            self.toggle_cell(row, col)
+        # Motion events arrive many times per cell; act only on entering a new one
+        cell = self.cell_at(event.x, event.y)
+        if cell is None or cell == self.last_drag_cell:
+            return
+        self.last_drag_cell = cell
+        self.toggle_cell(*cell)
 
     def stop_drag(self, event):
         self.is_dragging = False
+        self.last_drag_cell = None
 
     def toggle_cell(self, row, col):
-        cell = self.cells.get((row, col))
-        if cell:
-            if self.toggle_to_black and cell.cget("bg") != "#333":
-                self.update_cell(row, col, value="", bg="#333", fg="#333")
-                self.grid[row][col] = "#"
-                self.update_numbers_after_removal(row, col)
-            elif not self.toggle_to_black and cell.cget("bg") == "#333":
-                self.update_cell(row, col, value="", bg="#f8f9fa", fg="#444")
-                self.grid[row][col] = " "
+        if (row, col) not in self.cells:
+            return
+        if self.toggle_to_black and not self.is_black(row, col):
+            self.update_cell(row, col, value="", bg=self.BLACK, fg=self.BLACK)
+            self.grid[row][col] = "#"
+            self.update_numbers_after_removal(row, col)
+        elif not self.toggle_to_black and self.is_black(row, col):
+            self.update_cell(row, col, value="", bg="#f8f9fa", fg="#444")
+            self.grid[row][col] = " "
 
     def update_cell(self, row, col, value=None, bg=None, fg=None):
         """
         Update the content and appearance of a cell.
 
+        Only the canvas items whose text or colour actually changes are
+        reconfigured, so repainting a grid costs one call per changed cell.
+
         Args:
             row (int): Row index.
             col (int): Column index.
@@ -645,14 +757,18 @@ class CrosswordSolver(tk.Tk):
             bg (str): Background color.
             fg (str): Foreground color.
         """
-        cell = self.cells.get((row, col))
-        if cell:
-            if value is not None:
-                cell.config(text=value)
-            if bg is not None:
-                cell.config(bg=bg)
-            if fg is not None:
-                cell.config(fg=fg)
+        if (row, col) not in self.cells:
+            return
+        rect, text = self.cells[(row, col)]
+        old_value, old_bg, old_fg = self.cell_states[(row, col)]
+        value = old_value if value is None else value
+        bg = old_bg if bg is None else bg
+        fg = old_fg if fg is None else fg
+        if bg != old_bg:
+            self.grid_canvas.itemconfigure(rect, fill=bg)
+        if value != old_value or fg != old_fg:
+            self.grid_canvas.itemconfigure(text, text=value, fill=fg)
+        self.cell_states[(row, col)] = (value, bg, fg)
 
     def add_number_to_cell(self, row, col):
         """
@@ -800,458 +916,109 @@ class CrosswordSolver(tk.Tk):
                 "Solver Busy", "A puzzle is already being solved. Please wait.")
             return
         self.is_solving = True
+        self.cancel_event.clear()
         self.solve_crossword_button.config(state="disabled")
+        self.stop_solving_button.config(state="normal")
         self.update_status("Setting up constraints...", clear=True)
-        threading.Thread(target=self.solve_crossword_thread).start()
+        threading.Thread(target=self.solve_crossword_thread,
+                         args=(self.parallel_var.get(), self.time_limit_var.get() or None,
+                               self.live_var.get()),
+                         daemon=True).start()
 
-    def solve_crossword_thread(self):
+    def stop_solving(self):
+        """
+        Ask the running solve to stop; it finishes with a "cancelled" status.
+        """
+        self.cancel_event.set()
+        if self.portfolio is not None:
+            self.portfolio.cancel()
+        self.update_status("Stopping...")
+
+    def solve_crossword_thread(self, parallel=False, time_limit=None, live=False):
         """
         Core solving logic executed in a separate thread.
+
+        Args:
+            parallel (bool): Race several engine configurations across all CPU cores.
+            time_limit (float): Seconds allowed for the solve; None for no limit.
+            live (bool): Draw the partial solution while the search runs;
+                ignored for parallel solves, whose searches run in other processes.
         """
-        start_time = time.time()
         try:
-            random.seed(None)  # Always random seed
-            self.debug_log("Random seed set to system time at start of solving.")
-
             # Validate the grid before solving
             if not self.validate_grid():
-                self.is_solving = False
-                self.solve_crossword_button.config(state="normal")
-                return
-
-            self.generate_slots()
-            if not self.slots:
-                messagebox.showwarning(
-                    "Warning", "No numbered slots found to solve.")
-                self.is_solving = False
-                self.solve_crossword_button.config(state="normal")
                 return
 
-            self.randomize_domains()  # Shuffle domains for initial randomness
-            self.update_status("Running AC-3 algorithm...")
-
-            ac3_result = self.ac3()
-
-            has_empty_domain = any(
-                len(domain) == 0 for domain in self.domains.values())
-
-            if not ac3_result or has_empty_domain:
-                self.update_status(
-                    "AC-3 failed or domains wiped out. Attempting backtracking...")
+            if parallel:
+                if self.portfolio is None:
+                    self.portfolio = PortfolioSolver(self.words_path or self.engine.words)
+                self.update_status(f"Solving on {self.portfolio.workers} processes...")
+                result = self.portfolio.solve(self.grid.tolist(), time_limit=time_limit)
             else:
-                self.update_status("Starting backtracking search...")
-
-            # Display domain sizes
-            self.display_domain_sizes()
-
-            # Performance metrics for heuristic backtracking
-            self.recursive_calls = 0
-            backtracking_start = time.time()
-            result = self.backtracking_solve()
-            backtracking_end = time.time()
-            backtracking_time = backtracking_end - backtracking_start
-            total_time = time.time() - start_time
-
-            if result:
-                self.update_status("Solution found with backtracking.")
-                self.performance_data['Backtracking'] = {
-                    'time': backtracking_time,
-                    'calls': self.recursive_calls
-                }
-                self.display_solution()
-                self.display_word_list()
-                self.update_status(
-                    f"Total solving time: {total_time:.2f} seconds")
-                self.log_performance_metrics()
-            else:
-                self.update_status("No possible solution found.")
+                self.engine.progress_callback = self.receive_frame if live else None
+                result = self.engine.solve(self.grid, time_limit=time_limit)
+            self.post(self.show_result, result, time_limit)
+        except GridError as e:
+            self.post(messagebox.showwarning, "Warning", str(e))
         except Exception as e:
-            messagebox.showerror(
-                "Error", f"An error occurred during solving: {e}")
+            self.post(messagebox.showerror, "Error", f"An error occurred during solving: {e}")
         finally:
-            self.solve_crossword_button.config(state="normal")
-            self.is_solving = False
-
-    def validate_grid(self):
-        """
-        Validate the input grid for basic solvability criteria.
-
-        Returns:
-            bool: True if the grid is valid, False otherwise.
-        """
-        if not self.grid.size:
-            messagebox.showwarning(
-                "Warning", "The grid is empty. Please generate or load a grid.")
-            return False
-
-        # Check for sufficient slots
-        self.generate_slots()
-        if not self.slots:
-            messagebox.showwarning(
-                "Warning", "No valid slots found in the grid.")
-            return False
-
-        return True
-
-    def generate_slots(self):
-        """
-        Identify all slots in the grid and generate constraints.
-        """
-        self.slots.clear()
-        self.domains.clear()
-        self.cell_contents.clear()
-
-        rows, cols = self.grid.shape
-
-        # Record pre-filled letters and numbered cells
-        for r in range(rows):
-            for c in range(cols):
-                cell = self.grid[r][c]
-                key = f"{r},{c}"
-                if cell.isalpha():
-                    self.cell_contents[key] = cell
-                elif cell != "#" and cell.strip() != "":
-                    self.cell_contents[key] = None
-
-        # Identify slots
-        for r in range(rows):
-            for c in range(cols):
-                cell = self.grid[r][c]
-                if cell.isdigit():
-                    if c == 0 or self.grid[r][c - 1] == "#":
-                        positions = self.get_slot_positions(r, c, "across")
-                        if len(positions) >= 2:
-                            slot_name = f"{cell}ACROSS"
-                            self.slots[slot_name] = positions
-                    if r == 0 or self.grid[r - 1][c] == "#":
-                        positions = self.get_slot_positions(r, c, "down")
-                        if len(positions) >= 2:
-                            slot_name = f"{cell}DOWN"
-                            self.slots[slot_name] = positions
-
-        self.generate_constraints()
-        self.setup_domains()
-
-    def get_slot_positions(self, r, c, direction):
-        """
-        Get the positions of cells in a slot starting from (r, c).
-
-        Args:
-            r (int): Row index.
-            c (int): Column index.
-            direction (str): 'across' or 'down'.
-
-        Returns:
-            list: Positions in the slot.
-        """
-        positions = []
-        rows, cols = self.grid.shape
-
-        while r < rows and c < cols and self.grid[r][c] != "#":
-            positions.append((r, c))
-            if direction == "across":
-                c += 1
-            else:
-                r += 1
-
-        return positions
-
-    def generate_constraints(self):
-        """
-        Generate constraints between overlapping slots.
-        """
-        self.constraints.clear()
-        position_map = {}
-
-        for slot, positions in self.slots.items():
-            for idx, pos in enumerate(positions):
-                key = f"{pos[0]},{pos[1]}"
-                position_map.setdefault(key, []).append({'slot': slot, 'idx': idx})
-
-        for overlaps in position_map.values():
-            if len(overlaps) > 1:
-                for i in range(len(overlaps)):
-                    for j in range(i + 1, len(overlaps)):
-                        slot1 = overlaps[i]['slot']
-                        idx1 = overlaps[i]['idx']
-                        slot2 = overlaps[j]['slot']
-                        idx2 = overlaps[j]['idx']
-
-                        self.constraints.setdefault(slot1, {}).setdefault(slot2, []).append((idx1, idx2))
-                        self.constraints.setdefault(slot2, {}).setdefault(slot1, []).append((idx2, idx1))
-
-    def setup_domains(self):
-        """
-        Set up the domains for each slot based on possible words and pre-filled letters.
-        """
-        self.domains.clear()
-        for slot, positions in self.slots.items():
-            length = len(positions)
-            regex_pattern = ''.join(
-                self.cell_contents.get(f"{r},{c}") or '.' for r, c in positions
-            )
-            regex = re.compile(f"^{regex_pattern}$")
-
-            possible_words = self.word_length_cache.get(length, [])
-            filtered_words = [word for word in possible_words if regex.match(word)]
+            self.post(self.finish_solving)
 
-            self.domains[slot] = filtered_words
-
-    def word_matches_pre_filled_letters(self, slot, word):
-        """
-        Check if a word matches the pre-filled letters in a slot.
-
-        Args:
-            slot (str): The slot identifier.
-            word (str): The word to check.
-
-        Returns:
-            bool: True if the word matches pre-filled letters, False otherwise.
-        """
-        positions = self.slots[slot]
-        for idx, (row, col) in enumerate(positions):
-            key = f"{row},{col}"
-            pre_filled_letter = self.cell_contents.get(key)
-            if pre_filled_letter and pre_filled_letter != word[idx]:
-                return False
-        return True
-
-    def ac3(self):
-        """
-        Perform the AC-3 algorithm with arc consistency.
-
-        Returns:
-            bool: True if arc consistency is achieved, False otherwise.
-        """
-        queue = set((var1, var2) for var1 in self.constraints for var2 in self.constraints[var1])
-
-        while queue:
-            var1, var2 = queue.pop()
-            if self.revise(var1, var2):
-                if not self.domains[var1]:
-                    return False  # Domain wiped out, no solution
-                for neighbor in self.constraints[var1]:
-                    if neighbor != var2:
-                        queue.add((neighbor, var1))
-        return True
-
-    def revise(self, var1, var2):
-        """
-        Revise the domain of var1 to ensure consistency with var2.
-
-        Args:
-            var1 (str): Variable to revise.
-            var2 (str): Variable to check against.
-
-        Returns:
-            bool: True if the domain was revised, False otherwise.
+    def show_result(self, result, time_limit=None):
         """
-        revised = False
-        overlaps = self.constraints[var1][var2]
-        new_domain = []
-
-        for word1 in self.domains[var1]:
-            if any(self.words_match(var1, word1, var2, word2) for word2 in self.domains[var2]):
-                new_domain.append(word1)
-            else:
-                revised = True
-
-        if revised:
-            self.domains[var1] = new_domain
-        return revised
-
-    def words_match(self, var1, word1, var2, word2):
-        """
-        Check if two words are consistent at their overlapping positions.
+        Show the outcome of a solve; runs on the main loop.
 
         Args:
-            var1 (str): First variable.
-            word1 (str): Word assigned to var1.
-            var2 (str): Second variable.
-            word2 (str): Word assigned to var2.
-
-        Returns:
-            bool: True if words are consistent, False otherwise.
-        """
-        overlaps = self.constraints[var1][var2]
-        for idx1, idx2 in overlaps:
-            if word1[idx1] != word2[idx2]:
-                return False
-        return True
-
-    def backtracking_solve(self, assignment=None, cache=None):
-        """
-        Recursive backtracking search with heuristics and memoization.
-
-        Args:
-            assignment (dict): Current variable assignments.
-            cache (dict): Memoization cache.
-
-        Returns:
-            bool: True if a solution is found, False otherwise.
-        """
-        if assignment is None:
-            assignment = {}
-        if cache is None:
-            cache = {}
-
-        if len(assignment) == len(self.slots):
-            self.solution = assignment.copy()
-            return True
-
-        self.recursive_calls += 1
-
-        assignment_key = tuple(sorted(assignment.items()))
-        if assignment_key in cache:
-            return cache[assignment_key]
-
-        var_to_assign = self.select_unassigned_variable(assignment)
-        if not var_to_assign:
-            return False
-
-        for value in self.order_domain_values(var_to_assign, assignment):
-            if self.is_consistent(var_to_assign, value, assignment):
-                assignment[var_to_assign] = value
-                inferences = self.forward_check(var_to_assign, value, assignment)
-                if inferences is not False:
-                    result = self.backtracking_solve(assignment, cache)
-                    if result:
-                        cache[assignment_key] = True
-                        return True
-                del assignment[var_to_assign]
-                self.restore_domains(inferences)
-
-        cache[assignment_key] = False
-        return False
-
-    def select_unassigned_variable(self, assignment):
-        """
-        Select the next unassigned variable using MRV and degree heuristics, with random tie-breaking.
-
-        Args:
-            assignment (dict): Current variable assignments.
-
-        Returns:
-            str: The selected variable.
-        """
-        unassigned_vars = [v for v in self.domains if v not in assignment]
-        if not unassigned_vars:
-            return None
-
-        # Use MRV (minimum domain size) and degree (most constraints)
-        min_size = min(len(self.domains[var]) for var in unassigned_vars)
-        candidates = [var for var in unassigned_vars if len(self.domains[var]) == min_size]
-
-        # If there's a tie, select the variable with the most constraints (degree heuristic)
-        max_degree = max(len(self.constraints.get(var, {})) for var in candidates)
-        candidates = [var for var in candidates if len(self.constraints.get(var, {})) == max_degree]
-
-        # If still tied, select randomly
-        return random.choice(candidates)
+            result (SolveResult): The solver's result.
+            time_limit (float): The time limit the solve ran under.
+        """
+        # The search is over, so no newer frame can arrive after this one is dropped
+        self.live_frame = None
+        if self.live_shown:
+            self.show_partial({})
+        self.slots = result.slots
+        if result.solved:
+            self.solution = result.solution
+            self.update_status("Solution found with backtracking.")
+            self.performance_data['Backtracking'] = {
+                'time': result.stats['backtracking_time'],
+                'calls': result.stats['recursive_calls'],
+                'phases': result.stats.get('phase_times', {}),
+            }
+            self.display_solution()
+            self.display_word_list()
+            self.update_status(
+                f"Total solving time: {result.stats['total_time']:.2f} seconds")
+            self.log_performance_metrics()
+        elif result.status == "timeout":
+            self.update_status(f"Timed out after {time_limit} seconds without a solution.")
+        elif result.status == "cancelled":
+            self.update_status("Solving stopped.")
+        else:
+            self.update_status("No possible solution found.")
 
-    def order_domain_values(self, variable, assignment):
+    def finish_solving(self):
         """
-        Order the domain values for a variable using the Least Constraining Value heuristic.
-
-        Args:
-            variable (str): The variable to order values for.
-            assignment (dict): Current variable assignments.
-
-        Returns:
-            list: Ordered list of domain values.
+        Re-enable the solve controls once the solver thread is done.
         """
-        def value_score(value):
-            return sum(self.letter_frequencies[char] for char in value)
+        self.solve_crossword_button.config(state="normal")
+        self.stop_solving_button.config(state="disabled")
+        self.is_solving = False
 
-        # Order by heuristic but shuffle to ensure randomness
-        values = sorted(self.domains[variable], key=lambda val: (value_score(val)))
-        random.shuffle(values)  # Shuffle the sorted list for additional randomness
-        return values
-
-    def is_consistent(self, variable, value, assignment):
+    def validate_grid(self):
         """
-        Check if assigning a value to a variable is consistent with the current assignment and
-        does not wipe out the domains of unassigned neighbors.
-
-        Args:
-            variable (str): The variable to assign.
-            value (str): The value to assign.
-            assignment (dict): Current variable assignments.
+        Validate the input grid for basic solvability criteria.
 
         Returns:
-            bool: True if consistent, False otherwise.
+            bool: True if the grid is valid, False otherwise.
         """
-        if not self.word_matches_pre_filled_letters(variable, value):
+        if not self.grid.size:
+            self.post(messagebox.showwarning,
+                      "Warning", "The grid is empty. Please generate or load a grid.")
             return False
-
-        neighbors = self.constraints.get(variable)
-        if not neighbors:
-            return True
-
-        for neighbor in neighbors.keys():
-            if neighbor in assignment:
-                # Check consistency with assigned neighbors
-                if not self.words_match(variable, value, neighbor, assignment[neighbor]):
-                    return False
-            else:
-                # Check if the assignment would wipe out the neighbor's domain
-                new_domain = [
-                    neighbor_value for neighbor_value in self.domains[neighbor]
-                    if self.words_match(variable, value, neighbor, neighbor_value)
-                ]
-                if not new_domain:
-                    return False  # Assignment invalidates neighbor's domain
         return True
 
-    def forward_check(self, variable, value, assignment):
-        """
-        Perform forward checking after assigning a value to a variable.
-
-        Args:
-            variable (str): The variable assigned.
-            value (str): The value assigned.
-            assignment (dict): Current variable assignments.
-
-        Returns:
-            dict or bool: Inferences made or False if inconsistency is found.
-        """
-        inferences = {}
-        neighbors = self.constraints.get(variable)
-        if not neighbors:
-            return inferences
-
-        for neighbor in neighbors.keys():
-            if neighbor not in assignment:
-                inferences[neighbor] = self.domains[neighbor][:]
-                new_domain = [
-                    val for val in self.domains[neighbor]
-                    if self.words_match(variable, value, neighbor, val)
-                ]
-                if not new_domain:
-                    return False  # Inconsistency found
-                self.domains[neighbor] = new_domain
-        return inferences
-
-    def restore_domains(self, inferences):
-        """
-        Restore domains to their previous state after backtracking.
-
-        Args:
-            inferences (dict): Inferences to restore.
-        """
-        if not inferences:
-            return
-        for variable, domain in inferences.items():
-            self.domains[variable] = domain
-
-    def randomize_domains(self):
-        """
-        Shuffle domain values to introduce randomness.
-        """
-        for domain in self.domains.values():
-            random.shuffle(domain)  # Shuffle every domain
-        self.debug_log("Domains randomized.")
-
     # ------------------------- Solution Display Methods -------------------------
 
     def timed_execution(self, func, *args, **kwargs):
@@ -1268,11 +1035,44 @@ class CrosswordSolver(tk.Tk):
         for slot, word in self.solution.items():
             positions = self.slots[slot]
             for idx, (row, col) in enumerate(positions):
-                cell = self.cells.get((row, col))
-                if cell:
-                    self.update_cell(row, col, value=word[idx], fg="#155724", bg="#d1e7dd")
+                self.update_cell(row, col, value=word[idx], fg="#155724", bg="#d1e7dd")
         self.debug_log("Solution displayed on the grid.")
 
+    def receive_frame(self, partial):
+        """
+        Keep the solver's newest partial solution for the next UI poll.
+
+        Called on the solver thread by the engine's progress sampling; the
+        frame replaces any that has not been drawn yet.
+
+        Args:
+            partial (dict): Slot names mapped to the words placed so far.
+        """
+        self.live_frame = partial
+
+    def show_partial(self, partial):
+        """
+        Draw a partial solution over the puzzle; runs on the main loop.
+
+        Cells outside the placed words go back to their puzzle contents.
+        update_cell skips cells whose look is unchanged, so a frame only
+        redraws the cells the search changed since the previous one.
+
+        Args:
+            partial (dict): Slot names mapped to the words placed so far.
+        """
+        letters = {}
+        slots = self.engine.slots
+        for slot, word in partial.items():
+            for letter, position in zip(word, slots.get(slot, ())):
+                letters[position] = letter
+        for (row, col) in self.cells:
+            if (row, col) in letters:
+                self.update_cell(row, col, value=letters[(row, col)], fg="#0c5460", bg="#d1ecf1")
+            else:
+                self.update_cell(row, col, *self.cell_state(self.grid[row][col]))
+        self.live_shown = bool(partial)
+
     def display_word_list(self):
         """
         Display the list of words used in the solution without ACROSS/DOWN labels.
@@ -1280,7 +1080,7 @@ class CrosswordSolver(tk.Tk):
         across_words = []
         down_words = []
 
-        for slot in sorted(self.slots.keys(), key=lambda s: int(re.match(r'\d+', s).group())):
+        for slot in sorted(self.slots.keys(), key=slot_sort_key):
             word = self.solution.get(slot)
             if word:
                 slot_number = re.match(r'\d+', slot).group()
@@ -1314,20 +1114,24 @@ class CrosswordSolver(tk.Tk):
             self.update_status(
                 f"{method} - Time: {time_taken:.4f}s, Recursive Calls: {calls}")
             self.debug_log(
-                f"{method} - Time: {time_taken:.4f}s, Recursive Calls: {calls}")
-
-    def display_domain_sizes(self):
-        """
-        Display the size of the domains for each slot.
-        """
-        self.update_status("Domain Sizes After Setup:")
-        for slot in sorted(self.domains.keys(), key=lambda s: int(re.match(r'\d+', s).group())):
-            domain_size = len(self.domains[slot])
-            self.update_status(f"Domain for {slot} has {domain_size} options.")
+                "{} - Time: {:.4f}s, Recursive Calls: {}", method, time_taken, calls)
+            for phase, seconds in data.get('phases', {}).items():
+                self.update_status(f"  {phase}: {seconds:.4f}s")
 
     # ------------------------- Run Application -------------------------
 
 # Run main
 if __name__ == "__main__":
-    app = CrosswordSolver()
-    app.mainloop()
+    parser = argparse.ArgumentParser(description="Custom Crossword Generator and Solver.")
+    parser.add_argument("--debug", action="store_true",
+                        help="write debug messages to the log file")
+    parser.add_argument("--log-file", default="debug.log",
+                        help="rotating log file (default: debug.log)")
+    args = parser.parse_args()
+
+    listener = start_logging(args.log_file, logging.DEBUG if args.debug else logging.WARNING)
+    try:
+        app = CrosswordSolver(debug=args.debug)
+        app.mainloop()
+    finally:
+        stop_logging(listener)
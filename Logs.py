@@ -0,0 +1,70 @@
+"""
+Non-blocking log setup.
+
+Log calls made by the solver and the GUI format the record and put it on a
+queue; a QueueListener thread writes it to a size-capped, rotating log file,
+so no solve ever waits on disk. Nothing is configured on import: an
+application calls start_logging once at startup and stop_logging on exit.
+
+Usage:
+    listener = start_logging("debug.log", logging.DEBUG)
+    try:
+        ...
+    finally:
+        stop_logging(listener)
+"""
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+LOG_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+
+# Size at which the log file is rotated, and how many old files are kept
+MAX_BYTES = 5 * 1024 * 1024
+BACKUP_COUNT = 3
+
+
+def start_logging(path="debug.log", level=logging.WARNING, max_bytes=MAX_BYTES,
+                  backup_count=BACKUP_COUNT):
+    """
+    Route the root logger through a queue to a rotating log file.
+
+    A QueueHandler left on the root logger by an earlier call is removed, so
+    calling this again redirects logging instead of writing every record twice.
+
+    Args:
+        path (str): Log file to write.
+        level (int): Lowest level logged. Records below it are dropped at
+            the call site, before any message is formatted.
+        max_bytes (int): Size at which the file is rotated.
+        backup_count (int): Number of rotated files kept.
+
+    Returns:
+        QueueListener: The running listener; pass it to stop_logging.
+    """
+    file_handler = RotatingFileHandler(path, maxBytes=max_bytes,
+                                       backupCount=backup_count, delay=True)
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    records = queue.SimpleQueue()
+    listener = QueueListener(records, file_handler, respect_handler_level=True)
+
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        if isinstance(handler, QueueHandler):
+            root.removeHandler(handler)
+    root.addHandler(QueueHandler(records))
+    root.setLevel(level)
+    listener.start()
+    return listener
+
+
+def stop_logging(listener):
+    """
+    Write out the queued records and close the log file.
+
+    Args:
+        listener (QueueListener): The listener returned by start_logging.
+    """
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
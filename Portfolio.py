@@ -0,0 +1,296 @@
+"""
+Parallel portfolio solving.
+
+Runs several differently tuned copies of the CrosswordEngine search in a
+process pool and keeps the first solution; the other copies are cancelled
+through a shared event that the search loop polls. Grids made of independent
+regions are instead split so that each region is solved by its own worker.
+"""
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from Engine import CrosswordEngine, SolveResult
+
+logger = logging.getLogger(__name__)
+
+# Search options cycled through by the workers of a portfolio
+DEFAULT_CONFIGS = [
+    {"variable_heuristic": "mrv", "value_randomization": "bucket"},
+    {"variable_heuristic": "dom/wdeg", "value_randomization": "bucket"},
+    {"variable_heuristic": "mrv", "value_randomization": "full"},
+    {"variable_heuristic": "dom/wdeg", "value_randomization": "none"},
+]
+
+# Counters that add up when per-component results are merged
+SUMMED_STATS = ("recursive_calls", "backtracks", "restarts", "backjumps",
+                "nogood_hits", "nogood_misses", "nogood_evictions", "nogoods",
+                "prunings", "wipeouts")
+
+# Stats of per-component results that run side by side, merged by taking the largest
+PARALLEL_STATS = ("ac3_time", "backtracking_time", "max_depth")
+
+# Per-process engine, built once by init_worker
+_worker_engine = None
+
+
+def load_engine(words, scores=None, options=None):
+    """
+    Build an engine from a word list or the path of one.
+
+    Args:
+        words (list or str): Words, or a path accepted by CrosswordEngine.load_words.
+        scores (list): Optional score of each word when words is a list.
+        options (dict): Optional keyword arguments for CrosswordEngine.
+
+    Returns:
+        CrosswordEngine: The engine, ready to solve.
+    """
+    engine = CrosswordEngine(**(options or {}))
+    if isinstance(words, str):
+        engine.load_words(words)
+    else:
+        engine.set_words(words, scores)
+    return engine
+
+
+def init_worker(words, scores=None, cancel_event=None, options=None):
+    """
+    Build the word index once per worker process.
+
+    Used as the pool initializer by PortfolioSolver, Batch.py and Server.py;
+    their tasks then reach the engine through worker_engine.
+
+    Args:
+        words (list or str): Word list shared by every worker, or its path.
+        scores (list): Optional score of each word when words is a list.
+        cancel_event: Event that stops the search when set.
+        options (dict): Optional keyword arguments for CrosswordEngine.
+    """
+    global _worker_engine
+    _worker_engine = load_engine(words, scores, options)
+    _worker_engine.cancel_event = cancel_event
+
+
+def worker_engine():
+    """
+    Return the engine built by init_worker in this process.
+
+    Returns:
+        CrosswordEngine: The worker's engine.
+    """
+    return _worker_engine
+
+
+def _solve_task(grid, options, worker, slots=None, expires=None, node_limit=None, seed=None):
+    """
+    Solve a grid in a worker process with the given search options.
+
+    Args:
+        grid: The crossword grid.
+        options (dict): Keyword arguments for CrosswordEngine.configure.
+        worker (int): Index of this copy within the portfolio.
+        slots (list): Optional subset of slots to fill.
+        expires (float): time.time() value at which the solve times out, so
+            time spent waiting for a free worker counts; None for no limit.
+        node_limit (int): Search nodes allowed; None for no limit.
+        seed (int): Seed for the worker's search; None for a fresh one.
+
+    Returns:
+        SolveResult: The worker's result, tagged with its index and options.
+    """
+    _worker_engine.configure(**options)
+    time_limit = None if expires is None else max(0.0, expires - time.time())
+    result = _worker_engine.solve(grid, slots=slots, time_limit=time_limit,
+                                  node_limit=node_limit, seed=seed)
+    result.stats['worker'] = worker
+    result.stats['options'] = dict(options)
+    return result
+
+
+class PortfolioSolver:
+    """
+    Keeps a warm process pool and races engine configurations against each other.
+
+    One solve runs at a time; concurrent calls to solve are serialised.
+    """
+
+    def __init__(self, words, workers=None, configs=None, scores=None):
+        """
+        Args:
+            words (list or str): Word list loaded into every worker, or its
+                path. Passing the path of a compiled dictionary lets each
+                worker map the file instead of receiving and indexing a copy.
+            workers (int): Number of processes; defaults to the CPU count.
+            configs (list): Search option dicts, cycled over the workers;
+                defaults to DEFAULT_CONFIGS.
+            scores (list): Optional score of each word when words is a list.
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.configs = configs or DEFAULT_CONFIGS
+        self.cancel_event = multiprocessing.Event()
+        self.lock = threading.Lock()
+        self.planner = load_engine(words, scores)  # Finds components in this process
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=init_worker,
+            initargs=(words if isinstance(words, str) else list(words),
+                      scores, self.cancel_event))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """
+        Stop any running search and shut the pool down.
+        """
+        self.cancel_event.set()
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+    def cancel(self):
+        """
+        Stop the solve in progress; it returns with a "cancelled" status.
+        """
+        self.cancel_event.set()
+
+    def solve(self, grid, time_limit=None, node_limit=None, seed=None):
+        """
+        Solve a grid in parallel.
+
+        A grid with a single connected region is raced by every configuration.
+        A grid with several independent regions has each region solved by its
+        own worker, and the region solutions are merged.
+
+        Args:
+            grid: The crossword grid.
+            time_limit (float): Seconds allowed for the solve; None for no limit.
+            node_limit (int): Search nodes allowed per worker; None for no limit.
+            seed (int): Base seed; worker i searches with seed + i. Which
+                worker wins still depends on timing, but the winner's result
+                can be repeated by solving with its 'seed' stat and 'options'.
+
+        Returns:
+            SolveResult: The first solved result, or the last unsolved one if
+                every worker exhausted its search or was stopped.
+
+        Raises:
+            GridError: If the grid is empty or has no numbered slots.
+        """
+        with self.lock:
+            expires = None if time_limit is None else time.time() + time_limit
+            self.planner.prepare(grid)
+            components = self.planner.find_components(self.planner.slots)
+            self.cancel_event.clear()
+            if len(components) > 1 and self.workers > 1:
+                return self.solve_components(grid, components, expires, node_limit, seed)
+            return self.race(grid, expires, node_limit, seed)
+
+    def race(self, grid, expires=None, node_limit=None, seed=None):
+        """
+        Run every configuration on the whole grid and keep the first solution.
+
+        Args:
+            grid: The crossword grid.
+            expires (float): time.time() value at which the workers time out.
+            node_limit (int): Search nodes allowed per worker.
+            seed (int): Base seed, offset by the worker index.
+
+        Returns:
+            SolveResult: The winning result, the first proof that the grid
+                is unsatisfiable, or the last result if every worker stopped.
+        """
+        pending = {
+            self.executor.submit(_solve_task, grid, self.configs[i % len(self.configs)], i,
+                                 expires=expires, node_limit=node_limit,
+                                 seed=None if seed is None else seed + i)
+            for i in range(self.workers)
+        }
+        result = None
+        try:
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result = future.result()
+                    if result.solved:
+                        logger.debug("Portfolio solved by worker %d", result.stats['worker'])
+                        return result
+                    if result.status == "unsatisfiable":
+                        # One exhausted search proves no other worker can succeed
+                        return result
+            return result
+        finally:
+            self.stop(pending)
+
+    def solve_components(self, grid, components, expires=None, node_limit=None, seed=None):
+        """
+        Solve each independent region of a grid in its own worker.
+
+        Args:
+            grid: The crossword grid.
+            components (list): Lists of slot names that share no cells.
+            expires (float): time.time() value at which the workers time out.
+            node_limit (int): Search nodes allowed per component.
+            seed (int): Base seed, offset by the component index.
+
+        Returns:
+            SolveResult: The merged result; unsolved if any region failed.
+        """
+        start_time = time.time()
+        pending = {
+            self.executor.submit(_solve_task, grid, self.configs[i % len(self.configs)], i,
+                                 slots=component, expires=expires, node_limit=node_limit,
+                                 seed=None if seed is None else seed + i)
+            for i, component in enumerate(components)
+        }
+        results = []
+        try:
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result = future.result()
+                    results.append(result)
+                    if not result.solved:
+                        # One region without a fill sinks the whole grid
+                        break
+                else:
+                    continue
+                break
+        finally:
+            self.stop(pending)
+
+        solved = len(results) == len(components) and all(r.solved for r in results)
+        solution = {}
+        stats = {key: 0 for key in SUMMED_STATS + PARALLEL_STATS}
+        for result in results:
+            solution.update(result.solution)
+            for key in SUMMED_STATS:
+                stats[key] += result.stats.get(key, 0)
+            for key in PARALLEL_STATS:
+                stats[key] = max(stats[key], result.stats.get(key, 0))
+        stats.update({
+            'slots': len(self.planner.slots),
+            'components': len(components),
+            'total_time': time.time() - start_time,
+        })
+        # The loop stops at the first region without a fill, so it is the last result
+        status = None if solved else results[-1].status
+        return SolveResult(solved, solution if solved else {}, dict(self.planner.slots),
+                           stats, status)
+
+    def stop(self, pending):
+        """
+        Cancel outstanding tasks and wait for them so the next solve starts clean.
+
+        Args:
+            pending (set): Futures that have not finished.
+        """
+        self.cancel_event.set()
+        for future in pending:
+            future.cancel()
+        wait(pending)
@@ -0,0 +1,134 @@
+"""
+Solver profiling.
+
+Solves grids in this process and reports where the time went: the engine's
+phase timers and search counters for every grid, optionally written out as
+JSON, and optionally a cProfile run of the whole batch saved for pstats or
+printed as the most expensive functions.
+
+Usage:
+    python Profile.py Puzzles/grids.txt
+    python Profile.py --json stats.json --pstats solve.prof hard.json
+    python Profile.py --top 25 --seed 1 hard.json
+"""
+import argparse
+import cProfile
+import json
+import pstats
+import sys
+
+from Batch import read_grids
+from Engine import DEFAULT_WORDS, CrosswordEngine, GridError
+
+# Search counters printed for every grid
+REPORTED_STATS = ("recursive_calls", "backtracks", "backjumps", "restarts", "max_depth",
+                  "revisions", "ac3_prunings", "prunings", "wipeouts",
+                  "nogood_hits", "nogood_misses")
+
+
+def profile_grids(engine, grids, limits, profiler=None):
+    """
+    Solve grids one after another, optionally under a profiler.
+
+    Args:
+        engine (CrosswordEngine): Engine with the word list loaded.
+        grids (iterable): (name, source, grid) tuples.
+        limits (dict): time_limit, node_limit and seed for CrosswordEngine.solve.
+        profiler (cProfile.Profile): Enabled only while the engine solves, so
+            reading the inputs is left out of the profile.
+
+    Returns:
+        list: One record per grid with its status and full stats.
+    """
+    records = []
+    for name, source, grid in grids:
+        record = {"name": name, "source": source}
+        try:
+            if profiler is not None:
+                profiler.enable()
+            try:
+                result = engine.solve(grid, **limits)
+            finally:
+                if profiler is not None:
+                    profiler.disable()
+        except GridError as e:
+            record["error"] = str(e)
+        else:
+            record.update({"status": result.status, "stats": result.stats})
+        records.append(record)
+    return records
+
+
+def format_record(record):
+    """
+    Describe one grid's timings and counters for the terminal.
+
+    Args:
+        record (dict): A record from profile_grids.
+
+    Returns:
+        str: A few lines of text.
+    """
+    title = f"{record['name'] or record['source']}"
+    if "error" in record:
+        return f"{title}: {record['error']}"
+    stats = record["stats"]
+    phases = ", ".join(f"{phase} {seconds:.4f}s"
+                       for phase, seconds in stats["phase_times"].items())
+    counters = ", ".join(f"{key} {stats[key]}" for key in REPORTED_STATS)
+    return (f"{title}: {record['status']} in {stats['total_time']:.4f}s\n"
+            f"  phases: {phases}\n"
+            f"  counters: {counters}")
+
+
+def main(argv=None):
+    """
+    Profile the solver on the given grids.
+
+    Args:
+        argv (list): Command-line arguments; defaults to sys.argv[1:].
+
+    Returns:
+        int: Exit status; 1 if any input or grid could not be processed.
+    """
+    parser = argparse.ArgumentParser(description="Show where the solver spends its time.")
+    parser.add_argument("inputs", nargs="*", default=["-"],
+                        help="grid files or directories; '-' or nothing reads stdin")
+    parser.add_argument("--words", default=DEFAULT_WORDS,
+                        help="word list or compiled dictionary (default: Data/Words.txt)")
+    parser.add_argument("--json", metavar="PATH",
+                        help="write every grid's stats to this JSON file")
+    parser.add_argument("--pstats", metavar="PATH",
+                        help="profile the solves with cProfile and save the pstats dump here")
+    parser.add_argument("--top", type=int, default=0, metavar="N",
+                        help="profile the solves and print the N most expensive functions")
+    parser.add_argument("--time-limit", type=float, help="seconds allowed per grid")
+    parser.add_argument("--node-limit", type=int, help="search nodes allowed per grid")
+    parser.add_argument("--seed", type=int, help="seed every solve for repeatable results")
+    args = parser.parse_args(argv)
+
+    engine = CrosswordEngine()
+    profiler = cProfile.Profile() if args.pstats or args.top else None
+    limits = {"time_limit": args.time_limit, "node_limit": args.node_limit, "seed": args.seed}
+    try:
+        engine.load_words(args.words)
+        records = profile_grids(engine, read_grids(args.inputs), limits, profiler)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    for record in records:
+        print(format_record(record))
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(records, f, indent=2)
+    if profiler is not None:
+        if args.pstats:
+            profiler.dump_stats(args.pstats)
+        if args.top:
+            pstats.Stats(profiler).sort_stats("cumulative").print_stats(args.top)
+    return 1 if any("error" in record for record in records) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
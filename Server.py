@@ -0,0 +1,337 @@
+"""
+Local HTTP solve service.
+
+Loads the word list once into a pool of warm worker processes and serves
+solve requests as JSON, together with the web front end in this directory,
+so repeated solves skip the start-up cost of the GUI or the in-page solver.
+
+Endpoints:
+    POST /solve    {"grid": [...], "timeout": 10, "node_limit": 100000,
+                    "seed": 42, "options": {...}}
+                   "options" takes CrosswordEngine keyword arguments such as
+                   "min_score" or "variable_heuristic".
+    GET  /health   Pool size and default timeout.
+    GET  /<file>   The front end: index.html, script.js, style.css and Data/.
+
+Usage:
+    python Server.py --port 8000 --words Words.dict
+"""
+import argparse
+import inspect
+import json
+import logging
+import os
+import posixpath
+import time
+from concurrent.futures import ProcessPoolExecutor
+from http import HTTPStatus
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlsplit
+
+from Engine import DEFAULT_WORDS, CrosswordEngine
+from Portfolio import init_worker, worker_engine
+
+logger = logging.getLogger(__name__)
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Front-end files served over GET; nothing else in the directory is exposed
+STATIC_FILES = ("/", "/index.html", "/script.js", "/style.css")
+STATIC_DIRS = ("/Data/",)
+
+# Largest request body accepted, in bytes
+MAX_BODY = 1 << 20
+
+# Engine options a request may set, with the values they reset to between requests
+ENGINE_DEFAULTS = {
+    name: parameter.default
+    for name, parameter in inspect.signature(CrosswordEngine.__init__).parameters.items()
+    if name in inspect.signature(CrosswordEngine.configure).parameters
+    and parameter.default is not inspect.Parameter.empty
+}
+
+
+def _word_count():
+    """
+    Report the size of the worker's word list; used to warm the pool.
+
+    Returns:
+        int: Number of words loaded.
+    """
+    return len(worker_engine().words)
+
+
+def _solve_task(grid, options, expires, node_limit, seed):
+    """
+    Solve one request in a worker process.
+
+    Args:
+        grid (list): The grid rows.
+        options (dict): Engine options for this request only.
+        expires (float): time.time() value at which the request times out;
+            wall-clock time because it is computed in the server process.
+        node_limit (int): Search nodes allowed, or None for no limit.
+        seed (int): Seed for the search, or None for a fresh one.
+
+    Returns:
+        SolveResult: The engine's result.
+    """
+    engine = worker_engine()
+    engine.configure(**{**ENGINE_DEFAULTS, **options})
+    return engine.solve(grid, time_limit=max(0.0, expires - time.time()),
+                        node_limit=node_limit, seed=seed)
+
+
+def parse_request(request, default_timeout, max_timeout):
+    """
+    Validate the body of a solve request.
+
+    Args:
+        request: The decoded JSON body.
+        default_timeout (float): Timeout used when the request gives none.
+        max_timeout (float): Upper bound on the requested timeout.
+
+    Returns:
+        tuple: (grid, options, timeout, node_limit, seed).
+
+    Raises:
+        ValueError: If the request is malformed.
+    """
+    if not isinstance(request, dict) or not isinstance(request.get("grid"), list):
+        raise ValueError("The request must be an object with a 'grid' list.")
+    for row in request["grid"]:
+        if not isinstance(row, list) or any(
+                isinstance(cell, bool) or not isinstance(cell, (str, int)) for cell in row):
+            raise ValueError("Every grid row must be a list of strings or integers.")
+    options = request.get("options", {})
+    if not isinstance(options, dict):
+        raise ValueError("'options' must be an object.")
+    unknown = set(options) - set(ENGINE_DEFAULTS)
+    if unknown:
+        raise ValueError(f"Unknown options: {', '.join(sorted(unknown))}")
+    # Reject bad types and values here, as a 400, rather than in a worker
+    CrosswordEngine(**options)
+    timeout = request.get("timeout", default_timeout)
+    if not isinstance(timeout, (int, float)) or isinstance(timeout, bool) or timeout <= 0:
+        raise ValueError("'timeout' must be a positive number of seconds.")
+    node_limit = request.get("node_limit")
+    if node_limit is not None and (not isinstance(node_limit, int) or isinstance(node_limit, bool)
+                                   or node_limit <= 0):
+        raise ValueError("'node_limit' must be a positive integer.")
+    seed = request.get("seed")
+    if seed is not None and (not isinstance(seed, int) or isinstance(seed, bool)):
+        raise ValueError("'seed' must be an integer.")
+    return request["grid"], options, min(timeout, max_timeout), node_limit, seed
+
+
+class SolveHandler(SimpleHTTPRequestHandler):
+    """
+    Serves /solve and /health, and the front-end files from the repository root.
+    """
+
+    server_version = "CrosswordSolver/1.0"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, directory=ROOT, **kwargs)
+
+    def end_headers(self):
+        # Let a front end opened from another origin or from disk call the service
+        self.send_header("Access-Control-Allow-Origin", "*")
+        super().end_headers()
+
+    def do_OPTIONS(self):
+        self.send_response(HTTPStatus.NO_CONTENT)
+        self.send_header("Access-Control-Allow-Methods", "GET, POST, OPTIONS")
+        self.send_header("Access-Control-Allow-Headers", "Content-Type")
+        self.end_headers()
+
+    def do_GET(self):
+        if self.path == "/health":
+            self.send_json(HTTPStatus.OK, self.server.health())
+        elif self.is_static():
+            super().do_GET()
+        else:
+            self.send_json(HTTPStatus.NOT_FOUND, {"error": "Not found."})
+
+    def do_HEAD(self):
+        if self.is_static():
+            super().do_HEAD()
+        else:
+            self.send_error(HTTPStatus.NOT_FOUND)
+
+    def is_static(self):
+        """
+        Check whether the request is for one of the front-end files.
+
+        Returns:
+            bool: True for STATIC_FILES and files under STATIC_DIRS.
+        """
+        path = posixpath.normpath(unquote(urlsplit(self.path).path))
+        if path in STATIC_FILES:
+            return True
+        return any(path.startswith(directory) for directory in STATIC_DIRS)
+
+    def do_POST(self):
+        if self.path != "/solve":
+            self.send_json(HTTPStatus.NOT_FOUND, {"error": "Not found."})
+            return
+        try:
+            length = self.content_length()
+            if length > MAX_BODY:
+                self.send_json(HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                               {"error": "Request too large."})
+                return
+            grid, options, timeout, node_limit, seed = parse_request(
+                json.loads(self.rfile.read(length) or b"null"),
+                self.server.default_timeout, self.server.max_timeout)
+            result = self.server.solve(grid, options, timeout, node_limit, seed)
+        except ValueError as e:
+            # A bad Content-Length, malformed JSON, bad options and GridError all land here
+            self.send_json(HTTPStatus.BAD_REQUEST, {"error": str(e)})
+            return
+        except Exception as e:
+            logger.exception("Solve request failed")
+            self.send_json(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": str(e)})
+            return
+        self.send_json(HTTPStatus.OK, result.to_dict())
+
+    def content_length(self):
+        """
+        Read the size of the request body from its headers.
+
+        Returns:
+            int: The body length in bytes; 0 when no length is given.
+
+        Raises:
+            ValueError: If Content-Length is not a non-negative integer.
+        """
+        value = self.headers.get("Content-Length") or "0"
+        try:
+            length = int(value)
+        except ValueError:
+            length = -1
+        if length < 0:
+            raise ValueError(f"Invalid Content-Length: {value!r}")
+        return length
+
+    def send_json(self, status, payload):
+        """
+        Send a JSON response.
+
+        Args:
+            status (HTTPStatus): Response status.
+            payload: JSON-serialisable body.
+        """
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.info("%s - " + format, self.address_string(), *args)
+
+
+class SolveServer(ThreadingHTTPServer):
+    """
+    HTTP server that hands solve requests to a pool of warm engine processes.
+
+    Each request is handled on its own thread, which waits on the pool, so
+    up to `workers` grids are solved at once and the rest queue. A request's
+    timeout starts when it arrives, so time spent queued counts against it.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address, words, workers, default_timeout, max_timeout):
+        """
+        Args:
+            address (tuple): (host, port) to listen on.
+            words (str): Path to a text word list or compiled dictionary.
+            workers (int): Number of solver processes.
+            default_timeout (float): Seconds allowed when a request gives none.
+            max_timeout (float): Upper bound on any request's timeout.
+        """
+        super().__init__(address, SolveHandler)
+        self.workers = workers
+        self.default_timeout = default_timeout
+        self.max_timeout = max_timeout
+        self.executor = ProcessPoolExecutor(
+            max_workers=workers, initializer=init_worker, initargs=(words,))
+        # Load the word list in every worker before the first request arrives
+        counts = [self.executor.submit(_word_count) for _ in range(workers)]
+        self.word_count = max(future.result() for future in counts)
+
+    def solve(self, grid, options, timeout, node_limit=None, seed=None):
+        """
+        Solve a grid in the pool.
+
+        Args:
+            grid (list): The grid rows.
+            options (dict): Engine options for this request.
+            timeout (float): Seconds before the search gives up.
+            node_limit (int): Search nodes allowed, or None for no limit.
+            seed (int): Seed for the search, or None for a fresh one.
+
+        Returns:
+            SolveResult: The engine's result.
+        """
+        future = self.executor.submit(_solve_task, grid, options, time.time() + timeout,
+                                      node_limit, seed)
+        return future.result()
+
+    def health(self):
+        """
+        Describe the server for /health.
+
+        Returns:
+            dict: Word count, pool size and timeouts.
+        """
+        return {
+            "status": "ok",
+            "words": self.word_count,
+            "workers": self.workers,
+            "default_timeout": self.default_timeout,
+            "max_timeout": self.max_timeout,
+        }
+
+    def server_close(self):
+        super().server_close()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+def main(argv=None):
+    """
+    Run the solve service until interrupted.
+
+    Args:
+        argv (list): Command-line arguments; defaults to sys.argv[1:].
+    """
+    parser = argparse.ArgumentParser(description="Serve crossword solving over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1", help="address to bind (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--words", default=DEFAULT_WORDS,
+                        help="word list or compiled dictionary (default: Data/Words.txt)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="number of solver processes (default: CPU count)")
+    parser.add_argument("--timeout", type=float, default=30.0,
+                        help="seconds allowed per request when it gives none")
+    parser.add_argument("--max-timeout", type=float, default=300.0,
+                        help="upper bound on any request's timeout")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    server = SolveServer((args.host, args.port), args.words, max(1, args.workers),
+                         args.timeout, args.max_timeout)
+    logger.info("Serving %d words on http://%s:%d/", server.word_count, args.host, args.port)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@
 
     // Constants and configurations
     const DEBUG = false; // Toggle debug messages
+    const SOLVE_URL = "/solve"; // Local solve service (Server.py), used when the page is served by it
     const wordLengthCache = new Map();
     const memoizedMaxNumber = {};
 
@@ -646,8 +647,48 @@
         }
     }
 
+    // Fill the grid through the local solve service; returns false if it is unavailable
+    async function solveOnServer() {
+        let response;
+        try {
+            response = await fetch(SOLVE_URL, {
+                method: "POST",
+                headers: { "Content-Type": "application/json" },
+                body: JSON.stringify({ grid })
+            });
+        } catch (error) {
+            debugLog("Solve service unavailable, using the in-page solver:", DEBUG, error);
+            return false;
+        }
+
+        // Static hosting answers POST with 404, 405 or 501
+        if ([404, 405, 501].includes(response.status)) return false;
+
+        const data = await response.json().catch(() => ({ error: `Solve service error ${response.status}` }));
+        if (!response.ok) {
+            document.getElementById("result").textContent = data.error;
+            return true;
+        }
+
+        debugLog("Solve service stats:", DEBUG, data.stats);
+        slots = new Map(Object.entries(data.slots));
+        solution = data.solution;
+        if (data.status === "solved") {
+            displaySolution();
+            displayWordList();
+        } else if (data.status === "timeout") {
+            document.getElementById("result").textContent = "Timed out before finding a solution.";
+        } else {
+            document.getElementById("result").textContent = "No possible solution.";
+        }
+        return true;
+    }
+
     // Solve the crossword with UI feedback and debug
     async function solveCrossword() {
+        document.getElementById("result").textContent = "Solving...";
+        if (await solveOnServer()) return;
+
         // Shuffle domains for randomness
         randomizeDomains();
     
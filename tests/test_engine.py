@@ -0,0 +1,183 @@
+"""
+Checks of the search engine against a plain chronological backtracker.
+"""
+import os
+import random
+
+import pytest
+
+from Engine import CrosswordEngine, read_word_list
+
+WORDS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                          "Data", "Words.txt")
+
+# Search option sets; each must agree with the plain backtracker
+OPTION_SETS = [
+    {"backjumping": False, "restart_strategy": "none", "nogood_capacity": 0, "decompose": False},
+    {"backjumping": False, "restart_strategy": "luby", "restart_base": 1},
+    {"backjumping": True, "restart_strategy": "none"},
+    {"backjumping": True, "restart_strategy": "luby", "restart_base": 2,
+     "variable_heuristic": "dom/wdeg"},
+    {"backjumping": True, "restart_strategy": "geometric", "restart_base": 1,
+     "value_randomization": "full", "nogood_capacity": 50},
+    {"restart_strategy": "geometric", "restart_base": 1, "restart_factor": 1.001},
+    {"value_randomization": "none", "min_score": 0, "score_weight": 0},
+]
+
+
+@pytest.fixture(scope="module")
+def short_words():
+    words, _ = read_word_list(WORDS_PATH)
+    return sorted({word.upper() for word in words if 2 <= len(word) <= 6})
+
+
+def number_grid(cells):
+    """
+    Number the cells that start an across or down run of two or more.
+    """
+    rows, cols = len(cells), len(cells[0])
+    grid = [row[:] for row in cells]
+    number = 1
+    for r in range(rows):
+        for c in range(cols):
+            if cells[r][c] == "#":
+                continue
+            across = (c == 0 or cells[r][c - 1] == "#") and c + 1 < cols and cells[r][c + 1] != "#"
+            down = (r == 0 or cells[r - 1][c] == "#") and r + 1 < rows and cells[r + 1][c] != "#"
+            if across or down:
+                grid[r][c] = str(number)
+                number += 1
+    return grid
+
+
+def random_grid(rng):
+    """
+    Build a small numbered grid with random blocks.
+    """
+    rows, cols = rng.randint(3, 5), rng.randint(3, 6)
+    cells = [["#" if rng.random() < 0.3 else " " for _ in range(cols)] for _ in range(rows)]
+    return number_grid(cells)
+
+
+def plain_backtrack(slots, words):
+    """
+    Fill slots one after another, trying every word that fits the letters placed so far.
+
+    No propagation, heuristics or learning: the only shortcut is looking up
+    the words with the already placed letters in a (length, index, letter)
+    table instead of scanning the whole list.
+
+    Returns:
+        bool: True if every slot can be filled.
+    """
+    by_length = {}
+    by_letter = {}
+    for word in set(words):
+        by_length.setdefault(len(word), set()).add(word)
+        for idx, letter in enumerate(word):
+            by_letter.setdefault((len(word), idx, letter), set()).add(word)
+
+    # Each next slot is the one crossing the most cells already covered
+    remaining = sorted(slots.values(), key=len, reverse=True)
+    order = []
+    covered = set()
+    while remaining:
+        positions = max(remaining, key=lambda slot: len(covered.intersection(slot)))
+        remaining.remove(positions)
+        order.append(positions)
+        covered.update(positions)
+    letters = {}
+
+    def fill(i):
+        if i == len(order):
+            return True
+        positions = order[i]
+        candidates = by_length.get(len(positions), set())
+        for idx, pos in enumerate(positions):
+            if pos in letters:
+                candidates = candidates & by_letter.get((len(positions), idx, letters[pos]), set())
+        for word in candidates:
+            placed = [pos for pos in positions if pos not in letters]
+            for pos, letter in zip(positions, word):
+                letters.setdefault(pos, letter)
+            if fill(i + 1):
+                return True
+            for pos in placed:
+                del letters[pos]
+        return False
+
+    return fill(0)
+
+
+def assert_valid(result, words):
+    cells = {}
+    for slot, word in result.solution.items():
+        assert word in words
+        assert len(word) == len(result.slots[slot])
+        for pos, letter in zip(result.slots[slot], word):
+            assert cells.setdefault(pos, letter) == letter
+    assert set(result.solution) == set(result.slots)
+
+
+@pytest.fixture(scope="module")
+def random_cases(short_words):
+    """
+    Seeded random grids and word lists with the plain backtracker's verdict.
+    """
+    rng = random.Random(2024)
+    cases = []
+    while len(cases) < 60:
+        grid = random_grid(rng)
+        words = rng.sample(short_words, rng.choice([200, 800, 2000]))
+        engine = CrosswordEngine(words)
+        engine.grid = grid
+        engine.generate_slots()
+        if engine.slots:
+            cases.append((grid, words, rng.randrange(1 << 30),
+                          plain_backtrack(engine.slots, words)))
+    # The sample has to exercise both outcomes to mean anything
+    assert {expected for *_, expected in cases} == {True, False}
+    return cases
+
+
+@pytest.mark.parametrize("options", OPTION_SETS)
+def test_matches_plain_backtracking(random_cases, options):
+    for grid, words, seed, expected in random_cases:
+        result = CrosswordEngine(words, **options).solve(grid, seed=seed)
+        assert result.solved == expected, grid
+        assert result.status == ("solved" if expected else "unsatisfiable")
+        if result.solved:
+            assert_valid(result, set(words))
+
+
+def test_same_seed_same_search(short_words):
+    grid = number_grid([[" "] * 5 for _ in range(4)])
+    results = [CrosswordEngine(short_words).solve(grid, seed=7) for _ in range(2)]
+    assert results[0].solution == results[1].solution
+    assert results[0].stats["recursive_calls"] == results[1].stats["recursive_calls"]
+    assert results[0].stats["seed"] == 7
+
+
+def test_checkpoint_round_trip(short_words, tmp_path):
+    grid = number_grid([[" "] * 5 for _ in range(4)])
+    engine = CrosswordEngine(short_words, restart_strategy="none")
+    engine.set_limits()
+    engine.seed_rng(11)
+    engine.prepare(grid)
+    engine.plan_components()
+    assert engine.run_search(max_steps=5) is None
+    path = tmp_path / "search.json"
+    engine.save_checkpoint(str(path))
+
+    resumed = [CrosswordEngine(short_words, restart_strategy="none").resume(str(path))
+               for _ in range(2)]
+    assert resumed[0].solved
+    assert_valid(resumed[0], set(short_words))
+    assert resumed[0].solution == resumed[1].solution
+    # Nodes made before the checkpoint are kept in the count
+    assert resumed[0].stats["recursive_calls"] >= engine.recursive_calls > 0
+
+
+def test_missing_word_length_is_unsatisfiable(short_words):
+    result = CrosswordEngine(short_words).solve([["1"] + [" "] * 9])
+    assert result.status == "unsatisfiable"